@@ -3,40 +3,68 @@ from __future__ import annotations
 
 import logging
 import asyncio
+from typing import TYPE_CHECKING
 
-from pyspcwebgw import SpcWebGateway
-from pyspcwebgw.area import Area
-from pyspcwebgw.zone import Zone
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers import discovery, aiohttp_client  # Added aiohttp_client import
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 import homeassistant.helpers.config_validation as cv
-from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
 from homeassistant.helpers.typing import ConfigType
 
 from .const import (
     DOMAIN,
     DATA_API,
+    DATA_PROBED_PANELS,
+    CONF_ADMIN_PIN,
     CONF_WS_URL,
     CONF_API_URL,
+    SIGNAL_PANEL_CONFIG_CHANGED,
+    SIGNAL_TOPOLOGY_UPDATED,
     SIGNAL_UPDATE_ALARM,
     SIGNAL_UPDATE_SENSOR,
+    SOURCE_CAMERAS,
+    SOURCE_OUTPUTS,
+    SOURCE_TOPOLOGY,
 )
+from .runtime import SpcPanel, SpcRuntimeData, get_runtime
+
+# The gateway library and the helpers are imported where they are first
+# needed, so loading the package (for the config flow, for example) stays
+# cheap; benchmarks/import_time.py checks the import time budget.
+if TYPE_CHECKING:
+    from pyspcwebgw import SpcWebGateway
+
+    from .warm_start import WarmStart
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = [
+# Budget for a cold start; exceeding it is logged so regressions show up
+CORE_SETUP_TIME_BUDGET = 5.0  # seconds
+
+# Platforms are set up in stages: entities built from the loaded parameters
+# first, then the telemetry platforms that prime their coordinators in the
+# background, and finally the platforms that are slow or rarely needed.
+CORE_PLATFORMS = [
     Platform.ALARM_CONTROL_PANEL,
     Platform.BINARY_SENSOR,
-    Platform.SENSOR,
     Platform.LOCK,
+]
+TELEMETRY_PLATFORMS = [
+    Platform.SENSOR,
     Platform.SWITCH,
+]
+DEFERRED_PLATFORMS = [
     Platform.CAMERA,
     Platform.EVENT,
 ]
+PLATFORMS = CORE_PLATFORMS + TELEMETRY_PLATFORMS + DEFERRED_PLATFORMS
 
 CONFIG_SCHEMA = vol.Schema(
     {
@@ -51,17 +79,136 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
+def _async_handle_update(
+    hass: HomeAssistant, runtime: SpcRuntimeData, spc_object
+) -> None:
+    """Route a websocket update to the entities it affects."""
+    from pyspcwebgw.area import Area
+    from pyspcwebgw.zone import Zone
+
+    entry_id = runtime.entry_id
+    # Outputs are not pushed, but often follow area mode and zone alarms
+    outputs = runtime.coordinators.get(SOURCE_OUTPUTS)
+    if isinstance(spc_object, Area):
+        if outputs is not None:
+            outputs.async_pushed(spc_object)
+        async_dispatcher_send(
+            hass, SIGNAL_UPDATE_ALARM.format(entry_id, spc_object.id)
+        )
+    elif isinstance(spc_object, Zone):
+        if outputs is not None:
+            outputs.async_pushed(spc_object)
+        if runtime.zone_index is not None:
+            runtime.zone_index.update(spc_object)
+        if runtime.tracker is not None:
+            runtime.tracker.async_update(spc_object)
+        async_dispatcher_send(
+            hass, SIGNAL_UPDATE_SENSOR.format(entry_id, spc_object.id)
+        )
+    elif runtime.poller is not None:
+        runtime.poller.async_pushed(spc_object)
+
+    if runtime.decoder is not None and hasattr(runtime.api, "alerts"):
+        runtime.decoder.async_process(runtime.api.alerts.get("input"))
+
+
+def _supported_platforms(spc: SpcWebGateway, warm_start: WarmStart) -> list[Platform]:
+    """Return the platforms the panel has something to show on."""
+    platforms = list(PLATFORMS)
+    if not getattr(spc, "doors", None):
+        platforms.remove(Platform.LOCK)
+    if not getattr(spc, "events", None):
+        platforms.remove(Platform.EVENT)
+    # Only known after a first discovery; probe again when unknown
+    if warm_start.get(SOURCE_CAMERAS) == []:
+        platforms.remove(Platform.CAMERA)
+    return platforms
+
+
+def _staged(stage: list[Platform], platforms: list[Platform]) -> list[Platform]:
+    """Return the platforms of a setup stage that are supported."""
+    return [platform for platform in stage if platform in platforms]
+
+
+@callback
+def _async_check_time_budget(runtime: SpcRuntimeData) -> None:
+    """Warn when setting up the core platforms got too slow."""
+    if runtime.timings["core"] > CORE_SETUP_TIME_BUDGET:
+        _LOGGER.warning(
+            "Setting up acre Intrusion panel %s took %.3fs, over the %.1fs budget",
+            runtime.panel.host,
+            runtime.timings["core"],
+            CORE_SETUP_TIME_BUDGET,
+        )
+
+
+@callback
+def _async_stop_helpers(runtime: SpcRuntimeData) -> None:
+    """Stop the websocket and the helpers' timers and tasks that were started."""
+    for helper in (
+        runtime.supervisor,
+        runtime.poller,
+        runtime.commands,
+        runtime.tracker,
+    ):
+        if helper is not None:
+            helper.async_stop()
+
+
+async def _async_migrate_unique_ids(
+    hass: HomeAssistant, entry: ConfigEntry, panel: SpcPanel
+) -> None:
+    """Move entities and the devices of an entry onto the panel serial."""
+    legacy_prefix = f"{DOMAIN}_"
+    prefix = panel.unique_id("")
+
+    @callback
+    def async_migrate(entity_entry: er.RegistryEntry) -> dict[str, str] | None:
+        unique_id = entity_entry.unique_id
+        if unique_id.startswith(prefix) or not unique_id.startswith(legacy_prefix):
+            return None
+        return {"new_unique_id": prefix + unique_id[len(legacy_prefix):]}
+
+    await er.async_migrate_entries(hass, entry.entry_id, async_migrate)
+
+    device_registry = dr.async_get(hass)
+    device = device_registry.async_get_device(identifiers={(DOMAIN, panel.host)})
+    if device is not None:
+        device_registry.async_update_device(
+            device.id, new_identifiers={(DOMAIN, panel.serial)}
+        )
+
+    # Event devices were identified by the event id alone
+    for device in dr.async_entries_for_config_entry(device_registry, entry.entry_id):
+        identifiers = {
+            (domain, f"{panel.serial}_{identifier}")
+            if domain == DOMAIN and identifier.startswith("event_")
+            else (domain, identifier)
+            for domain, identifier in device.identifiers
+        }
+        if identifiers != device.identifiers:
+            device_registry.async_update_device(
+                device.id, new_identifiers=identifiers
+            )
+
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the acre_intrusion component."""
+    from .services import async_setup_services
+
+    async_setup_services(hass)
+
     # Configuration through config flow is preferred
     if DOMAIN not in config:
         return True
 
+    # Only needed for the legacy YAML setup
+    from pyspcwebgw import SpcWebGateway
+
+    from homeassistant.helpers import aiohttp_client, discovery
+
     async def async_update_callback(spc_object):
-        if isinstance(spc_object, Area):
-            async_dispatcher_send(hass, SIGNAL_UPDATE_ALARM.format(spc_object.id))
-        elif isinstance(spc_object, Zone):
-            async_dispatcher_send(hass, SIGNAL_UPDATE_SENSOR.format(spc_object.id))
+        _async_handle_update(hass, runtime, spc_object)
 
     session = aiohttp_client.async_get_clientsession(hass)
     domain_config = config.get(DOMAIN, {})
@@ -73,6 +220,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         ws_url=domain_config.get(CONF_WS_URL),
         async_callback=async_update_callback,
     )
+    runtime = SpcRuntimeData(entry_id=DOMAIN, api=spc)
 
     # Only proceed with setup if we have configuration
     if not domain_config:
@@ -94,16 +242,34 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up acre Intrusion from a config entry."""
+    from pyspcwebgw import SpcWebGateway
+    from pyspcwebgw.zone import Zone
+
+    from .activity import AreaActivityTracker
+    from .alerts import AlertDecoder
+    from .commands import CommandQueue
+    from .pool import GatewayPool
+    from .storage import PinStorage
+    from .topology import apply_topology_changes
+    from .warm_start import (
+        STATE_RESOURCES,
+        WarmStart,
+        apply_topology_states,
+        async_fetch_topology,
+        load_topology,
+    )
+    from .zone_index import ZoneStateIndex
+
     async def async_update_callback(spc_object):
         """Handle updates from the SPC panel."""
-        if isinstance(spc_object, Area):
-            async_dispatcher_send(hass, SIGNAL_UPDATE_ALARM.format(spc_object.id))
-        elif isinstance(spc_object, Zone):
-            async_dispatcher_send(hass, SIGNAL_UPDATE_SENSOR.format(spc_object.id))
+        _async_handle_update(hass, runtime, spc_object)
 
+    pool = GatewayPool(hass)
+    runtime: SpcRuntimeData | None = None
+    forwarded: list[Platform] = []
     try:
-        session = aiohttp_client.async_get_clientsession(hass)
-        
+        session = pool.session
+
         spc = SpcWebGateway(
             loop=asyncio.get_event_loop(),
             session=session,
@@ -111,40 +277,196 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             ws_url=entry.data[CONF_WS_URL],
             async_callback=async_update_callback,
         )
+        runtime = SpcRuntimeData(entry_id=entry.entry_id, api=spc, pool=pool)
+
+        warm_start = WarmStart(hass, entry.entry_id)
+        await warm_start.async_load()
 
-        # Initialize the connection
+        # Initialize the connection, from the stored topology when there is one
         try:
-            if not await spc.async_load_parameters():
+            topology = warm_start.get(SOURCE_TOPOLOGY)
+            if topology is None or "panel" not in topology:
+                # The config flow already read the panel of a new entry
+                probed = hass.data.get(DATA_PROBED_PANELS, {}).pop(
+                    entry.data[CONF_API_URL], None
+                )
+                topology = await async_fetch_topology(
+                    spc, known={"panel": probed} if probed else None
+                )
+                warm_start.async_update(SOURCE_TOPOLOGY, topology)
+            if topology is None or not load_topology(spc, topology):
                 _LOGGER.error("Failed to load parameters from SPC panel")
+                await pool.async_close()
                 return False
         except Exception as err:
             _LOGGER.error("Failed to connect to SPC panel: %s", err)
+            await pool.async_close()
             return False
 
-        # Store the API object
-        hass.data[DATA_API] = spc
+        runtime.record_timing("parameters")
+
+        api_ip = entry.data[CONF_API_URL].split("//")[-1].split("/")[0]
+        panel = SpcPanel(
+            entry.entry_id, topology["panel"].get("sn") or entry.entry_id, api_ip
+        )
+        await _async_migrate_unique_ids(hass, entry, panel)
+
+        runtime.panel = panel
+        runtime.warm_start = warm_start
+
+        # Seed the alert decoder so only later flips notify entities
+        runtime.decoder = AlertDecoder(hass, entry.entry_id)
+        if hasattr(spc, "alerts"):
+            runtime.decoder.async_process(spc.alerts.get("input"))
+
+        index = runtime.zone_index = ZoneStateIndex()
+        index.build(spc.zones.values())
+
+        tracker = runtime.tracker = AreaActivityTracker(hass, entry.entry_id)
+        tracker.build(spc.zones.values())
+
+        runtime.commands = CommandQueue(hass)
+        pins = runtime.pins = PinStorage(hass, entry.entry_id)
+        await pins.async_load()
+        if (admin_record := entry.data.get(CONF_ADMIN_PIN)) is not None:
+            # Set in the config flow before the entry id existed
+            await pins.async_store_admin_record(admin_record)
+            hass.config_entries.async_update_entry(
+                entry,
+                data={
+                    key: value
+                    for key, value in entry.data.items()
+                    if key != CONF_ADMIN_PIN
+                },
+            )
+
+        hass.data.setdefault(DOMAIN, {})[entry.entry_id] = runtime
+
+        platforms = runtime.platforms = _supported_platforms(spc, warm_start)
+
+        async def async_forward_stage(stage: list[Platform]) -> None:
+            """Set up the supported platforms of a stage."""
+            stage = _staged(stage, platforms)
+            # Recorded first, so a stage that fails halfway is unloaded too
+            forwarded.extend(stage)
+            await hass.config_entries.async_forward_entry_setups(entry, stage)
+
+        await async_forward_stage(CORE_PLATFORMS)
+        runtime.record_timing("core")
+        _async_check_time_budget(runtime)
+
+        async def async_resync() -> int:
+            """Report area and zone changes missed while disconnected."""
+            if (live := await async_fetch_topology(spc, STATE_RESOURCES)) is None:
+                _LOGGER.warning("Failed to resync area/zone states from SPC panel")
+                return 0
+            changed = apply_topology_states(spc, live)
+            for spc_object in changed:
+                _async_handle_update(hass, runtime, spc_object)
+            return len(changed)
+
+        # Only needed once the core platforms are up
+        from .connection import ConnectionSupervisor
+        from .devices import DevicePoller
+
+        poller = runtime.poller = DevicePoller(hass, spc, session, entry.entry_id)
 
-        # Set up all platforms using the new method
-        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-        
         # Start websocket connection
-        spc.start()
+        supervisor = runtime.supervisor = ConnectionSupervisor(
+            hass, entry, spc, async_resync
+        )
+        supervisor.async_start()
+        poller.async_start()
+
+        await async_forward_stage(TELEMETRY_PLATFORMS)
+        runtime.record_timing("telemetry")
+        await async_forward_stage(DEFERRED_PLATFORMS)
+        runtime.record_timing("deferred")
+
+        if warm_start.is_stale(SOURCE_TOPOLOGY):
+
+            async def async_refresh_topology() -> None:
+                """Replace the stored area and zone states with live ones."""
+                if (live := await async_fetch_topology(spc)) is None:
+                    _LOGGER.warning("Failed to refresh area/zone states from SPC panel")
+                    return
+                for spc_object in apply_topology_states(spc, live):
+                    _async_handle_update(hass, runtime, spc_object)
+                warm_start.async_update(SOURCE_TOPOLOGY, live)
+
+            entry.async_create_background_task(
+                hass, async_refresh_topology(), "acre_intrusion warm start refresh"
+            )
+
+        reload_lock = asyncio.Lock()
+
+        async def async_reload_topology() -> None:
+            """Apply added and removed areas and zones without a full reload."""
+            # Config change signals can arrive while a reload is still running
+            async with reload_lock:
+                if (live := await async_fetch_topology(spc)) is None:
+                    _LOGGER.warning("Failed to re-read topology from SPC panel")
+                    return
+                added, removed = apply_topology_changes(spc, live)
+                if Platform.CAMERA not in platforms and any(
+                    isinstance(spc_object, Zone) for spc_object in added
+                ):
+                    # New zones may have imaging; probe them on the next start
+                    warm_start.async_discard(SOURCE_CAMERAS)
+                index.build(spc.zones.values())
+                for spc_object in removed:
+                    if isinstance(spc_object, Zone):
+                        tracker.async_remove(spc_object.id)
+                tracker.build(obj for obj in added if isinstance(obj, Zone))
+                for spc_object in apply_topology_states(spc, live):
+                    _async_handle_update(hass, runtime, spc_object)
+                warm_start.async_update(SOURCE_TOPOLOGY, live)
+                if added or removed:
+                    _LOGGER.info(
+                        "Panel topology changed: %s added, %s removed",
+                        len(added),
+                        len(removed),
+                    )
+                async_dispatcher_send(
+                    hass, SIGNAL_TOPOLOGY_UPDATED.format(entry.entry_id)
+                )
+
+        entry.async_on_unload(
+            async_dispatcher_connect(
+                hass,
+                SIGNAL_PANEL_CONFIG_CHANGED.format(entry.entry_id),
+                async_reload_topology,
+            )
+        )
         return True
 
     except Exception as err:
         _LOGGER.error("Error setting up SPC integration: %s", err)
+        if forwarded:
+            try:
+                await hass.config_entries.async_unload_platforms(entry, forwarded)
+            except Exception:  # noqa: BLE001
+                _LOGGER.debug("Failed to unload the platforms set up", exc_info=True)
+        hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
+        if runtime is not None:
+            _async_stop_helpers(runtime)
+        await pool.async_close()
         return False
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    if entry.entry_id not in hass.data:
+    runtime: SpcRuntimeData | None = get_runtime(hass, entry.entry_id)
+    if runtime is None:
         return False
 
     unload_ok = await hass.config_entries.async_unload_platforms(
-        entry, PLATFORMS
+        entry, runtime.platforms
     )
     if unload_ok:
-        hass.data[DATA_API].stop()
-        hass.data.pop(DATA_API)
+        hass.data[DOMAIN].pop(entry.entry_id)
+        _async_stop_helpers(runtime)
+        for coordinator in runtime.coordinators.values():
+            await coordinator.async_shutdown()
+        await runtime.pool.async_close()
 
     return unload_ok
@@ -0,0 +1,166 @@
+"""Per-area occupancy and activity aggregates for acre Intrusion."""
+from __future__ import annotations
+
+from collections import deque
+import time
+
+from pyspcwebgw.const import ZoneInput, ZoneType
+from pyspcwebgw.zone import Zone
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later
+
+from .const import SIGNAL_UPDATE_AREA_ACTIVITY
+
+ACTIVITY_WINDOW = 600  # seconds
+ACTIVITY_CAPACITY = 1024
+
+
+class AreaActivityTracker:
+    """Incrementally maintained occupancy counters and activity window.
+
+    Occupancy is the number of open motion zones per area. Activity is a
+    sliding window of zone triggers kept in one bounded ring buffer, with
+    per-area counts maintained as entries enter and leave the window.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        window: float = ACTIVITY_WINDOW,
+        capacity: int = ACTIVITY_CAPACITY,
+    ) -> None:
+        """Initialize the tracker."""
+        self.hass = hass
+        self._entry_id = entry_id
+        self._window = window
+        self._capacity = capacity
+        self.areas: dict[str, str] = {}
+        self._zone_area: dict[str, str] = {}
+        self._motion: set[str] = set()
+        self._active: dict[str, bool] = {}
+        self._occupied: dict[str, int] = {}
+        self._events: deque[tuple[float, str, str]] = deque()
+        self._hits: dict[str, dict[str, int]] = {}
+        self._triggers: dict[str, int] = {}
+        self._unsub_expire: CALLBACK_TYPE | None = None
+
+    def build(self, zones) -> None:
+        """Seed the counters from the current zone states."""
+        for zone in zones:
+            area_id = zone.area.id
+            self.areas.setdefault(area_id, zone.area.name)
+            self._zone_area[zone.id] = area_id
+            self._occupied.setdefault(area_id, 0)
+            self._hits.setdefault(area_id, {})
+            self._triggers.setdefault(area_id, 0)
+            active = zone.input == ZoneInput.OPEN
+            self._active[zone.id] = active
+            if zone.type == ZoneType.ALARM:
+                self._motion.add(zone.id)
+                if active:
+                    self._occupied[area_id] += 1
+
+    @callback
+    def async_remove(self, zone_id: str) -> None:
+        """Forget a zone that is no longer configured."""
+        if (area_id := self._zone_area.pop(zone_id, None)) is None:
+            return
+        if self._active.pop(zone_id, False) and zone_id in self._motion:
+            self._occupied[area_id] -= 1
+        self._motion.discard(zone_id)
+        if area_id not in self._zone_area.values():
+            self.areas.pop(area_id, None)
+        async_dispatcher_send(
+            self.hass, SIGNAL_UPDATE_AREA_ACTIVITY.format(self._entry_id, area_id)
+        )
+
+    def has_motion_zones(self, area_id: str) -> bool:
+        """Return true if the area contains motion zones."""
+        return any(self._zone_area[zone_id] == area_id for zone_id in self._motion)
+
+    def is_occupied(self, area_id: str) -> bool:
+        """Return true if any motion zone in the area is active."""
+        return self._occupied.get(area_id, 0) > 0
+
+    def occupied_count(self, area_id: str) -> int:
+        """Return the number of active motion zones in the area."""
+        return self._occupied.get(area_id, 0)
+
+    def triggered_zones(self, area_id: str) -> int:
+        """Return the number of distinct zones triggered within the window."""
+        return len(self._hits.get(area_id, {}))
+
+    def trigger_count(self, area_id: str) -> int:
+        """Return the number of zone triggers within the window."""
+        return self._triggers.get(area_id, 0)
+
+    @callback
+    def async_update(self, zone: Zone) -> None:
+        """Apply a single zone event."""
+        previous = self._active.get(zone.id)
+        active = zone.input == ZoneInput.OPEN
+        if previous is None or previous == active:
+            return
+        self._active[zone.id] = active
+        area_id = self._zone_area[zone.id]
+
+        if zone.id in self._motion:
+            self._occupied[area_id] += 1 if active else -1
+
+        if active:
+            if len(self._events) >= self._capacity:
+                self._evict()
+            self._events.append((time.monotonic(), area_id, zone.id))
+            hits = self._hits[area_id]
+            hits[zone.id] = hits.get(zone.id, 0) + 1
+            self._triggers[area_id] += 1
+            self._schedule_expire()
+
+        async_dispatcher_send(
+            self.hass, SIGNAL_UPDATE_AREA_ACTIVITY.format(self._entry_id, area_id)
+        )
+
+    def _evict(self) -> str:
+        """Drop the oldest trigger from the window and return its area."""
+        _, area_id, zone_id = self._events.popleft()
+        self._triggers[area_id] -= 1
+        hits = self._hits[area_id]
+        if hits[zone_id] == 1:
+            del hits[zone_id]
+        else:
+            hits[zone_id] -= 1
+        return area_id
+
+    @callback
+    def _schedule_expire(self) -> None:
+        """Arm the timer for the oldest trigger in the window."""
+        if self._unsub_expire is not None or not self._events:
+            return
+        delay = self._events[0][0] + self._window - time.monotonic()
+        self._unsub_expire = async_call_later(
+            self.hass, max(delay, 0), self._async_expire
+        )
+
+    @callback
+    def _async_expire(self, _now=None) -> None:
+        """Drop triggers that left the window and notify their areas."""
+        self._unsub_expire = None
+        cutoff = time.monotonic() - self._window
+        changed: set[str] = set()
+        while self._events and self._events[0][0] <= cutoff:
+            changed.add(self._evict())
+        for area_id in changed:
+            async_dispatcher_send(
+                self.hass, SIGNAL_UPDATE_AREA_ACTIVITY.format(self._entry_id, area_id)
+            )
+        self._schedule_expire()
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the expiry timer."""
+        if self._unsub_expire is not None:
+            self._unsub_expire()
+            self._unsub_expire = None
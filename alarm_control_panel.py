@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import partial
+
 from pyspcwebgw import SpcWebGateway
 from pyspcwebgw.area import Area
 from pyspcwebgw.const import AreaMode
@@ -12,13 +14,23 @@ from homeassistant.components.alarm_control_panel import (
     AlarmControlPanelState,
 )
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.config_entries import ConfigEntry
 
-from .const import DATA_API, SIGNAL_UPDATE_ALARM, DOMAIN, CONF_API_URL
+from .commands import CommandQueue
+from .const import (
+    DATA_API,
+    SIGNAL_TOPOLOGY_UPDATED,
+    SIGNAL_UPDATE_ALARM,
+)
+from .runtime import SpcPanel, SpcRuntimeData, get_runtime
 from .storage import PinStorage
+from .topology import EntitySync
+from .warm_start import RestoredStateEntity, WarmStartEntity
+from .zone_index import ZoneStateIndex
 
 import re
 import logging
@@ -57,13 +69,37 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> bool:
     """Set up the acre Intrusion alarm control panel from a config entry."""
-    api: SpcWebGateway = hass.data[DATA_API]
-    api_ip = entry.data[CONF_API_URL].split("//")[-1].split("/")[0]
-    async_add_entities([SpcAlarm(area=area, api=api, api_ip=api_ip) for area in api.areas.values()])
+    runtime: SpcRuntimeData = get_runtime(hass, entry.entry_id)
+    api = runtime.api
+    sync = EntitySync(hass, async_add_entities)
+
+    async def async_sync_areas() -> None:
+        """Create an alarm panel for every configured area."""
+        await sync.async_sync(
+            {
+                area.id: partial(
+                    SpcAlarm,
+                    area=area,
+                    api=api,
+                    panel=runtime.panel,
+                    pins=runtime.pins,
+                    zone_index=runtime.zone_index,
+                    commands=runtime.commands,
+                )
+                for area in api.areas.values()
+            }
+        )
+
+    await async_sync_areas()
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_TOPOLOGY_UPDATED.format(entry.entry_id), async_sync_areas
+        )
+    )
     return True
 
 
-class SpcAlarm(AlarmControlPanelEntity):
+class SpcAlarm(RestoredStateEntity, WarmStartEntity, AlarmControlPanelEntity):
     """Representation of the SPC alarm panel."""
 
     _attr_should_poll = False
@@ -75,26 +111,34 @@ class SpcAlarm(AlarmControlPanelEntity):
     _attr_code_arm_required = True
     _attr_code_format = "^[0-9]{6}$"  # Require exactly 6 digits
 
-    def __init__(self, area: Area, api: SpcWebGateway, api_ip: str) -> None:
+    def __init__(
+        self,
+        area: Area,
+        api: SpcWebGateway,
+        panel: SpcPanel,
+        pins: PinStorage,
+        zone_index: ZoneStateIndex | None = None,
+        commands: CommandQueue | None = None,
+    ) -> None:
         """Initialize the SPC alarm panel."""
         self._area = area
         self._api = api
+        self._panel = panel
+        self._pins = pins
+        self._zone_index = zone_index
+        self._commands = commands
         self._attr_name = area.name
-        self._attr_unique_id = f"acre_intrusion_alarm_{area.id}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, api_ip)},
-            "name": f"SPC Panel ({api_ip})",
-            "manufacturer": "Vanderbilt",
-            "model": "SPC Controller",
-        }
+        self._attr_unique_id = panel.unique_id(f"alarm_{area.id}")
+        self._attr_device_info = panel.device_info("SPC Controller")
         self._valid_codes = self._api.get_user_codes() if hasattr(self._api, 'get_user_codes') else None
 
     async def async_added_to_hass(self) -> None:
         """Call for adding new entities."""
+        await super().async_added_to_hass()
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                SIGNAL_UPDATE_ALARM.format(self._area.id),
+                SIGNAL_UPDATE_ALARM.format(self._panel.entry_id, self._area.id),
                 self._update_callback,
             )
         )
@@ -109,60 +153,100 @@ class SpcAlarm(AlarmControlPanelEntity):
         """Return the user the last change was triggered by."""
         return self._area.last_changed_by
 
+    @property
+    def _has_live_state(self) -> bool:
+        """Return true once the area mode maps to an alarm state."""
+        return _get_alarm_state(self._area) is not None
+
     @property
     def alarm_state(self) -> AlarmControlPanelState | None:
         """Return the state of the device."""
-        return _get_alarm_state(self._area)
+        if (state := _get_alarm_state(self._area)) is not None:
+            return state
+        if self._restored_state in set(AlarmControlPanelState):
+            return AlarmControlPanelState(self._restored_state)
+        return None
 
     async def _validate_code(self, code: str | None) -> bool:
         """Validate given code."""
         if code is None:
             return False
             
-        pin_storage = PinStorage(self.hass)
+        pin_storage = self._pins
         await pin_storage.async_load()
         return pin_storage.verify_pin(code)
 
+    def _check_ready(self) -> None:
+        """Fail fast if open alarm zones would block fully setting the area.
+
+        Part set modes exclude zones according to the panel configuration,
+        which the gateway does not expose, so they are left to the panel.
+        """
+        if self._zone_index is None or self._zone_index.is_ready(self._area.id):
+            return
+        blocking = self._zone_index.blocking_zones(self._area.id)
+        raise HomeAssistantError(
+            f"Cannot arm {self._area.name}, open zones: "
+            + ", ".join(zone.name for zone in blocking)
+        )
+
+    async def _async_change_mode(self, new_mode: AreaMode) -> None:
+        """Send a mode change through the per-area command queue."""
+        if self._commands is None:
+            result = await self._api.change_mode(area=self._area, new_mode=new_mode)
+        else:
+            result = await self._commands.async_submit(
+                ("area", self._area.id),
+                ("mode", new_mode),
+                lambda: self._api.change_mode(area=self._area, new_mode=new_mode),
+                group="mode",
+            )
+        if result is False:
+            raise HomeAssistantError(
+                f"Failed to change {self._area.name} to {new_mode.name}"
+            )
+
     async def async_alarm_disarm(self, code: str | None = None) -> None:
         """Send disarm command."""
-        pin_storage = PinStorage(self.hass)
+        pin_storage = self._pins
         await pin_storage.async_load()
         
         if not pin_storage.verify_pin(code):
             _LOGGER.warning("Invalid code provided for disarming")
             return
 
-        await self._api.change_mode(area=self._area, new_mode=AreaMode.UNSET)
+        await self._async_change_mode(AreaMode.UNSET)
 
     async def async_alarm_arm_home(self, code: str | None = None) -> None:
         """Send arm home command."""
-        pin_storage = PinStorage(self.hass)
+        pin_storage = self._pins
         await pin_storage.async_load()
         
         if not pin_storage.verify_pin(code):
             _LOGGER.warning("Invalid code provided for arming home")
             return
 
-        await self._api.change_mode(area=self._area, new_mode=AreaMode.PART_SET_A)
+        await self._async_change_mode(AreaMode.PART_SET_A)
 
     async def async_alarm_arm_night(self, code: str | None = None) -> None:
         """Send arm night command."""
-        if not self._validate_code(code):
+        if not await self._validate_code(code):
             _LOGGER.warning("Invalid code provided for arming night")
             return
 
-        await self._api.change_mode(area=self._area, new_mode=AreaMode.PART_SET_B)
+        await self._async_change_mode(AreaMode.PART_SET_B)
 
     async def async_alarm_arm_away(self, code: str | None = None) -> None:
         """Send arm away command."""
-        pin_storage = PinStorage(self.hass)
+        pin_storage = self._pins
         await pin_storage.async_load()
         
         if not pin_storage.verify_pin(code):
             _LOGGER.warning("Invalid code provided for arming away")
             return
 
-        await self._api.change_mode(area=self._area, new_mode=AreaMode.FULL_SET)
+        self._check_ready()
+        await self._async_change_mode(AreaMode.FULL_SET)
 
 
 class IntrusionAlarm(AlarmControlPanelEntity):
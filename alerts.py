@@ -0,0 +1,82 @@
+"""System alert decoding for acre Intrusion."""
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.util import dt as dt_util
+
+from .const import SIGNAL_UPDATE_ALERT
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AlertDecoder:
+    """Decode the system-alert bitmask once per change."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the decoder."""
+        self.hass = hass
+        self._entry_id = entry_id
+        self._raw: str | None = None
+        self._mask = 0
+        self._raised: dict[int, datetime] = {}
+        self._cleared: dict[int, datetime] = {}
+
+    @property
+    def mask(self) -> int:
+        """Return the last decoded bitmask."""
+        return self._mask
+
+    def is_active(self, alert_id: int) -> bool:
+        """Return true if the given alert bit is set."""
+        return bool(self._mask >> alert_id & 1)
+
+    def raised_at(self, alert_id: int) -> datetime | None:
+        """Return when the alert was last raised."""
+        return self._raised.get(alert_id)
+
+    def cleared_at(self, alert_id: int) -> datetime | None:
+        """Return when the alert was last cleared."""
+        return self._cleared.get(alert_id)
+
+    @callback
+    def async_process(self, raw: str | None) -> int:
+        """Decode a raw alert value and notify the alerts whose bits flipped.
+
+        Returns the mask of changed bits. The first value seen only seeds the
+        decoder, since the time those alerts were raised is unknown.
+        """
+        if raw is None or raw == self._raw:
+            return 0
+
+        try:
+            mask = int(raw, 16)
+        except (TypeError, ValueError):
+            _LOGGER.warning("Could not decode system alert value: %s", raw)
+            return 0
+
+        seeding = self._raw is None
+        self._raw = raw
+        changed = mask ^ self._mask
+        self._mask = mask
+        if seeding or not changed:
+            return 0
+
+        now = dt_util.utcnow()
+        pending = changed
+        while pending:
+            lowest = pending & -pending
+            alert_id = lowest.bit_length() - 1
+            if mask & lowest:
+                self._raised[alert_id] = now
+            else:
+                self._cleared[alert_id] = now
+            async_dispatcher_send(
+                self.hass, SIGNAL_UPDATE_ALERT.format(self._entry_id, alert_id)
+            )
+            pending ^= lowest
+
+        return changed
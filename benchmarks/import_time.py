@@ -0,0 +1,51 @@
+"""Check the import time budget of the acre Intrusion package.
+
+Run from a Home Assistant environment where the integration is installed as
+custom_components/acre_intrusion:
+
+    python custom_components/acre_intrusion/benchmarks/import_time.py
+
+Home Assistant itself is imported first, so only the integration is timed.
+Importing the package must not load the gateway library or the helpers that
+are imported when an entry is set up.
+"""
+from __future__ import annotations
+
+import importlib
+from pathlib import Path
+import sys
+import time
+
+IMPORT_TIME_BUDGET = 0.5  # seconds
+PACKAGE = "custom_components.acre_intrusion"
+
+# Loaded only once a config entry is set up
+DEFERRED_MODULES = (
+    "pyspcwebgw",
+    f"{PACKAGE}.connection",
+    f"{PACKAGE}.devices",
+    f"{PACKAGE}.pool",
+    f"{PACKAGE}.services",
+    f"{PACKAGE}.warm_start",
+)
+
+
+def main() -> int:
+    """Import the package, then report its import time and eager imports."""
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+    importlib.import_module("homeassistant.helpers.config_validation")
+    importlib.import_module("homeassistant.helpers.entity")
+
+    started = time.perf_counter()
+    importlib.import_module(PACKAGE)
+    duration = time.perf_counter() - started
+
+    print(f"Imported {PACKAGE} in {duration:.3f}s (budget {IMPORT_TIME_BUDGET}s)")
+    eager = [module for module in DEFERRED_MODULES if module in sys.modules]
+    for module in eager:
+        print(f"{module} was imported with the package")
+    return int(duration > IMPORT_TIME_BUDGET or bool(eager))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import partial
+
 from pyspcwebgw import SpcWebGateway
 from pyspcwebgw.const import ZoneInput, ZoneType
 from pyspcwebgw.zone import Zone
@@ -15,7 +17,20 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
-from .const import CONF_API_URL, DATA_API, SIGNAL_UPDATE_SENSOR, DOMAIN
+from .activity import AreaActivityTracker
+from .alerts import AlertDecoder
+from .const import (
+    DATA_API,
+    SIGNAL_TOPOLOGY_UPDATED,
+    SIGNAL_UPDATE_ALERT,
+    SIGNAL_UPDATE_AREA_ACTIVITY,
+    SIGNAL_UPDATE_DOOR,
+    SIGNAL_UPDATE_SENSOR,
+    SIGNAL_UPDATE_WIRELESS,
+)
+from .runtime import SpcPanel, SpcRuntimeData, get_runtime
+from .topology import EntitySync
+from .warm_start import WarmStartEntity
 
 SYSTEM_ALERTS = {
     0: ("mains_fail", "Mains Power Fault", BinarySensorDeviceClass.PROBLEM),
@@ -93,64 +108,84 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> bool:
     """Set up acre Intrusion binary sensors."""
-    api = hass.data[DATA_API]
-    api_ip = entry.data[CONF_API_URL].split("//")[-1].split("/")[0]
+    runtime: SpcRuntimeData = get_runtime(hass, entry.entry_id)
+    api = runtime.api
+    panel = runtime.panel
+    tracker = runtime.tracker
+    sync = EntitySync(hass, async_add_entities)
     entities = []
 
-    # Add zone sensors
-    entities.extend(
-        [
-            SpcBinarySensor(zone, api_ip)
+    async def async_sync_zones() -> None:
+        """Create zone and area occupancy sensors for the configured topology."""
+        factories = {
+            # Keyed by area too, so a zone moved to another area is recreated
+            ("zone", zone.id, zone.area.id): partial(SpcBinarySensor, zone, panel)
             for zone in api.zones.values()
             if _get_device_class(zone.type)
-        ]
-    )
+        }
+        factories.update(
+            {
+                ("occupancy", area_id): partial(
+                    SpcAreaOccupancySensor, tracker, area_id, area_name, panel
+                )
+                for area_id, area_name in tracker.areas.items()
+                if tracker.has_motion_zones(area_id)
+            }
+        )
+        await sync.async_sync(factories)
 
     # Add door sensors
     if hasattr(api, 'doors'):
-        entities.extend([SpcDoorSensor(door, api_ip) for door in api.doors.values()])
+        entities.extend([SpcDoorSensor(door, panel) for door in api.doors.values()])
 
     # Add wireless sensors
     if hasattr(api, 'wireless_sensors'):
-        entities.extend([SpcWirelessSensor(sensor, api_ip) for sensor in api.wireless_sensors.values()])
+        entities.extend([SpcWirelessSensor(sensor, panel) for sensor in api.wireless_sensors.values()])
 
     # Add system alert sensors
     if hasattr(api, 'alerts'):
         entities.extend(
             [
-                SystemAlertSensor(api, alert_id, name, device_class, api_ip)
+                SystemAlertSensor(
+                    runtime.decoder, alert_id, name, device_class, panel
+                )
                 for alert_id, (key, name, device_class) in SYSTEM_ALERTS.items()
             ]
         )
 
     async_add_entities(entities)
+
+    # Add zone and area occupancy sensors, following topology changes
+    await async_sync_zones()
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_TOPOLOGY_UPDATED.format(entry.entry_id), async_sync_zones
+        )
+    )
     return True
 
 
-class SpcBinarySensor(BinarySensorEntity):
+class SpcBinarySensor(WarmStartEntity, BinarySensorEntity):
     """Representation of a sensor based on a Intrusion zone."""
 
     _attr_should_poll = False
 
-    def __init__(self, zone: Zone, api_ip: str) -> None:
+    def __init__(self, zone: Zone, panel: SpcPanel) -> None:
         """Initialize the sensor device."""
         self._zone = zone
         self._attr_name = zone.name
-        self._attr_unique_id = f"acre_intrusion_zone_{zone.id}"
+        self._panel = panel
+        self._attr_unique_id = panel.unique_id(f"zone_{zone.id}")
         self._attr_device_class = _get_device_class(zone.type)
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, api_ip)},
-            "name": f"SPC Panel ({api_ip})",
-            "manufacturer": "Vanderbilt",
-            "model": "SPC Controller",
-        }
+        self._attr_device_info = panel.device_info("SPC Controller")
 
     async def async_added_to_hass(self) -> None:
         """Call for adding new entities."""
+        await super().async_added_to_hass()
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                SIGNAL_UPDATE_SENSOR.format(self._zone.id),
+                SIGNAL_UPDATE_SENSOR.format(self._panel.entry_id, self._zone.id),
                 self._update_callback,
             )
         )
@@ -169,74 +204,189 @@ class SpcBinarySensor(BinarySensorEntity):
 class SystemAlertSensor(BinarySensorEntity):
     """Representation of a system alert sensor."""
 
-    def __init__(self, api, alert_id: int, name: str, device_class: str, api_ip: str) -> None:
+    _attr_should_poll = False
+
+    def __init__(
+        self, decoder: AlertDecoder, alert_id: int, name: str, device_class: str, panel: SpcPanel
+    ) -> None:
         """Initialize the sensor."""
-        self._api = api
+        self._decoder = decoder
         self._alert_id = alert_id
         self._attr_name = name
         self._attr_device_class = device_class
-        self._attr_unique_id = f"acre_intrusion_alert_{alert_id}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, api_ip)},
-            "name": f"SPC Panel ({api_ip})",
-            "manufacturer": "Vanderbilt",
-            "model": "SPC Controller",
-        }
+        self._panel = panel
+        self._attr_unique_id = panel.unique_id(f"alert_{alert_id}")
+        self._attr_device_info = panel.device_info("SPC Controller")
+
+    async def async_added_to_hass(self) -> None:
+        """Call for adding new entities."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_UPDATE_ALERT.format(self._panel.entry_id, self._alert_id),
+                self._update_callback,
+            )
+        )
+
+    @callback
+    def _update_callback(self) -> None:
+        """Write the state decoded by the alert decoder."""
+        self.async_write_ha_state()
 
     @property
     def is_on(self) -> bool:
         """Return true if the alert is active."""
-        alert_state = int(self._api.alerts.get("input", "0"), 16)
-        return bool(alert_state & (1 << self._alert_id))
+        return self._decoder.is_active(self._alert_id)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, str | None]:
+        """Return when the alert was last raised and cleared."""
+        raised = self._decoder.raised_at(self._alert_id)
+        cleared = self._decoder.cleared_at(self._alert_id)
+        return {
+            "raised_at": raised.isoformat() if raised else None,
+            "cleared_at": cleared.isoformat() if cleared else None,
+        }
+
+
+class SpcAreaOccupancySensor(BinarySensorEntity):
+    """Representation of motion occupancy in an SPC area."""
+
+    _attr_should_poll = False
+    _attr_device_class = BinarySensorDeviceClass.OCCUPANCY
+
+    def __init__(
+        self, tracker: AreaActivityTracker, area_id: str, area_name: str, panel: SpcPanel
+    ) -> None:
+        """Initialize the sensor."""
+        self._tracker = tracker
+        self._area_id = area_id
+        self._attr_name = f"{area_name} Occupancy"
+        self._panel = panel
+        self._attr_unique_id = panel.unique_id(f"area_{area_id}_occupancy")
+        self._attr_device_info = panel.device_info("SPC Controller")
+
+    async def async_added_to_hass(self) -> None:
+        """Call for adding new entities."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_UPDATE_AREA_ACTIVITY.format(self._panel.entry_id, self._area_id),
+                self._update_callback,
+            )
+        )
+
+    @callback
+    def _update_callback(self) -> None:
+        """Write the aggregated occupancy state."""
+        self.async_write_ha_state()
+
+    @property
+    def is_on(self) -> bool:
+        """Return true if any motion zone in the area is active."""
+        return self._tracker.is_occupied(self._area_id)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, int]:
+        """Return the number of active motion zones."""
+        return {"active_zones": self._tracker.occupied_count(self._area_id)}
 
 
 class SpcDoorSensor(BinarySensorEntity):
     """Representation of an SPC door sensor."""
 
-    def __init__(self, door, api_ip: str) -> None:
+    _attr_should_poll = False
+
+    def __init__(self, door, panel: SpcPanel) -> None:
         """Initialize the sensor."""
         self._door = door
+        self._status = None
         self._attr_name = f"Door {door.name}"
-        self._attr_unique_id = f"acre_intrusion_door_sensor_{door.id}"
+        self._panel = panel
+        self._attr_unique_id = panel.unique_id(f"door_sensor_{door.id}")
         self._attr_device_class = BinarySensorDeviceClass.DOOR
+        self._attr_device_info = panel.device_info("SPC Controller")
+        self._refresh_attributes()
+
+    def _refresh_attributes(self) -> bool:
+        """Recompute attributes if the door status changed."""
+        if self._door.status == self._status:
+            return False
+        self._status = self._door.status
         self._attr_extra_state_attributes = {
-            "door_status": DOOR_STATES.get(door.status, "unknown")
-        }
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, api_ip)},
-            "name": f"SPC Panel ({api_ip})",
-            "manufacturer": "Vanderbilt",
-            "model": "SPC Controller",
+            "door_status": DOOR_STATES.get(self._status, "unknown")
         }
+        return True
+
+    async def async_added_to_hass(self) -> None:
+        """Call for adding new entities."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_UPDATE_DOOR.format(self._panel.entry_id, self._door.id),
+                self._update_callback,
+            )
+        )
+
+    @callback
+    def _update_callback(self) -> None:
+        """Write state if the door status changed."""
+        if self._refresh_attributes():
+            self.async_write_ha_state()
 
     @property
     def is_on(self) -> bool:
         """Return true if door is open."""
-        return self._door.status in [1, 2, 3]  # Open states
+        return self._status in [1, 2, 3]  # Open states
 
 
 class SpcWirelessSensor(BinarySensorEntity):
     """Representation of an SPC wireless sensor."""
 
-    def __init__(self, sensor, api_ip: str) -> None:
+    _attr_should_poll = False
+
+    def __init__(self, sensor, panel: SpcPanel) -> None:
         """Initialize the sensor."""
         self._sensor = sensor
+        self._fields = None
         self._attr_name = f"Wireless {sensor.name}"
-        self._attr_unique_id = f"acre_intrusion_wireless_{sensor.id}"
+        self._panel = panel
+        self._attr_unique_id = panel.unique_id(f"wireless_{sensor.id}")
         self._attr_device_class = BinarySensorDeviceClass.MOTION
+        self._attr_device_info = panel.device_info("SPC Controller")
+        self._refresh_attributes()
+
+    def _refresh_attributes(self) -> bool:
+        """Recompute attributes if signal, battery or status changed."""
+        sensor = self._sensor
+        fields = (sensor.signal, sensor.battery, sensor.status)
+        if fields == self._fields:
+            return False
+        self._fields = fields
         self._attr_extra_state_attributes = {
             "signal_strength": sensor.signal,
             "battery_low": bool(sensor.battery == 1),
             "status": WIRELESS_STATES.get(sensor.status, "unknown")
         }
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, api_ip)},
-            "name": f"SPC Panel ({api_ip})",
-            "manufacturer": "Vanderbilt",
-            "model": "SPC Controller",
-        }
+        return True
+
+    async def async_added_to_hass(self) -> None:
+        """Call for adding new entities."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_UPDATE_WIRELESS.format(self._panel.entry_id, self._sensor.id),
+                self._update_callback,
+            )
+        )
+
+    @callback
+    def _update_callback(self) -> None:
+        """Write state if the wireless fields changed."""
+        if self._refresh_attributes():
+            self.async_write_ha_state()
 
     @property
     def is_on(self) -> bool:
         """Return true if sensor is triggered."""
-        return self._sensor.status in [2, 3]  # Open or fault states
+        return self._fields[2] in [2, 3]  # Open or fault states
@@ -0,0 +1,175 @@
+"""Alarm-triggered verification image bursts for acre Intrusion."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from contextlib import suppress
+from dataclasses import dataclass, field
+from datetime import datetime
+from http import HTTPStatus
+import logging
+import os
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .snapshot import SnapshotCache
+
+_LOGGER = logging.getLogger(__name__)
+
+BURST_FRAMES = 10
+BURST_INTERVAL = 0.5  # seconds
+TIMELINE_CAPACITY = 30
+DISK_FRAMES = 300  # per zone; older files are deleted
+
+
+@dataclass
+class TimelineFrame:
+    """A captured verification image."""
+
+    frame_id: int
+    captured_at: datetime
+    image: bytes = field(repr=False)
+
+
+def _write_frame(directory: str, frame: TimelineFrame, keep: int) -> None:
+    """Write a captured frame to disk and delete all but the newest keep."""
+    os.makedirs(directory, exist_ok=True)
+    filename = f"{frame.captured_at:%Y%m%dT%H%M%S%f}.jpg"
+    with open(os.path.join(directory, filename), "wb") as file:
+        file.write(frame.image)
+    # File names sort by capture time
+    saved = sorted(name for name in os.listdir(directory) if name.endswith(".jpg"))
+    for name in saved[:-keep]:
+        # Another burst's writer may have pruned it already
+        with suppress(FileNotFoundError):
+            os.remove(os.path.join(directory, name))
+
+
+class BurstRecorder:
+    """Capture a burst of frames when a zone goes into alarm.
+
+    Frames, including the last one cached before the alarm, are kept in a
+    fixed-size ring buffer so the UI and notifications can pull the timeline
+    without another gateway round trip. Frames can optionally be written to
+    disk as well, where the newest DISK_FRAMES per zone are kept.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        snapshots: SnapshotCache,
+        directory: str | None = None,
+        capacity: int = TIMELINE_CAPACITY,
+    ) -> None:
+        """Initialize the recorder."""
+        self.hass = hass
+        self._snapshots = snapshots
+        self.directory = directory
+        self._frames: deque[TimelineFrame] = deque(maxlen=capacity)
+        self._next_id = 1
+        self._last_version: int | None = None
+        self._task: asyncio.Task | None = None
+        self.last_burst: datetime | None = None
+
+    @property
+    def frames(self) -> list[TimelineFrame]:
+        """Return the captured frames, oldest first."""
+        return list(self._frames)
+
+    @property
+    def frame_count(self) -> int:
+        """Return the number of captured frames."""
+        return len(self._frames)
+
+    def get_frame(self, frame_id: int) -> TimelineFrame | None:
+        """Return a captured frame by id."""
+        for frame in self._frames:
+            if frame.frame_id == frame_id:
+                return frame
+        return None
+
+    @callback
+    def async_trigger(self) -> None:
+        """Start a burst unless one is already running."""
+        self.last_burst = dt_util.utcnow()
+        if self._task is None:
+            self._task = self.hass.async_create_background_task(
+                self._async_capture(), "acre_intrusion burst capture"
+            )
+
+    @callback
+    def _async_add(self, version: int, image: bytes) -> None:
+        """Append a frame unless it was already captured."""
+        if version == self._last_version:
+            return
+        self._last_version = version
+        captured_at = self._snapshots.fetched_at or dt_util.utcnow()
+        frame = TimelineFrame(self._next_id, captured_at, image)
+        self._next_id += 1
+        self._frames.append(frame)
+        if self.directory is not None:
+            self.hass.async_add_executor_job(
+                _write_frame, self.directory, frame, DISK_FRAMES
+            )
+
+    async def _async_capture(self) -> None:
+        """Fetch frames at the burst rate."""
+        try:
+            # Keep the last frame cached before the alarm as well
+            if (frame := self._snapshots.frame) is not None:
+                self._async_add(*frame)
+            for _ in range(BURST_FRAMES):
+                frame = await self._snapshots.async_refresh_frame()
+                if frame is not None:
+                    self._async_add(*frame)
+                await asyncio.sleep(BURST_INTERVAL)
+        finally:
+            self._task = None
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel a running burst."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+
+class TimelineView(HomeAssistantView):
+    """Serve the burst timeline of a camera."""
+
+    url = "/api/acre_intrusion/timeline/{entity_id}"
+    extra_urls = ["/api/acre_intrusion/timeline/{entity_id}/{frame_id}"]
+    name = "api:acre_intrusion:timeline"
+
+    def __init__(self, cameras: dict) -> None:
+        """Initialize the view with the registered cameras by entity id."""
+        self._cameras = cameras
+
+    async def get(
+        self, request: web.Request, entity_id: str, frame_id: str | None = None
+    ) -> web.Response:
+        """Return the frame list, or a single frame image."""
+        if (camera := self._cameras.get(entity_id)) is None:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+        recorder: BurstRecorder = camera.recorder
+
+        if frame_id is None:
+            return self.json(
+                [
+                    {
+                        "id": frame.frame_id,
+                        "captured_at": frame.captured_at.isoformat(),
+                        "url": f"/api/acre_intrusion/timeline/{entity_id}/{frame.frame_id}",
+                    }
+                    for frame in recorder.frames
+                ]
+            )
+
+        frame = recorder.get_frame(int(frame_id)) if frame_id.isdigit() else None
+        if frame is None:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+        return web.Response(body=frame.image, content_type="image/jpeg")
@@ -1,104 +1,311 @@
 """Support for SPC cameras."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable
 import logging
-import base64
 from typing import Any
+
 import aiohttp
+from aiohttp import web
 
-from pyspcwebgw import SpcWebGateway
+from pyspcwebgw.const import ZoneStatus
+from pyspcwebgw.zone import Zone
 
-from homeassistant.components.camera import Camera, CameraEntityFeature
+from homeassistant.components.camera import Camera
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers import aiohttp_client
+from homeassistant.helpers.event import async_call_later
 
-from .const import CONF_API_URL, DATA_API, DOMAIN
+from .const import (
+    CONF_BURST_TO_DISK,
+    CONF_PERCEPTUAL_HASH,
+    CONF_SNAPSHOT_TTL,
+    CONF_STREAM_FPS,
+    DATA_CAMERAS,
+    DEFAULT_SNAPSHOT_TTL,
+    DEFAULT_STREAM_FPS,
+    DOMAIN,
+    SIGNAL_TOPOLOGY_UPDATED,
+    SIGNAL_UPDATE_SENSOR,
+    SOURCE_CAMERAS,
+)
+from .burst import BurstRecorder, TimelineView
+from .mjpeg import MJPEG_BOUNDARY, MjpegFanout, mjpeg_part
+from .runtime import SpcPanel, SpcRuntimeData, get_runtime
+from .snapshot import ResizeCache, SnapshotCache, SnapshotView, async_probe_image
+from .topology import async_remove_entity
 
 _LOGGER = logging.getLogger(__name__)
 
+PROBE_CONCURRENCY = 8
+PROBE_RETRY = 300  # seconds until zones whose probe failed are probed again
+
+
+async def _async_probe(
+    session: aiohttp.ClientSession, api_url: str, zone_ids: list[str]
+) -> dict[str, bool | None]:
+    """Return per zone whether it has an image, or None if the probe failed."""
+    semaphore = asyncio.Semaphore(PROBE_CONCURRENCY)
+
+    async def probe(zone_id: str) -> tuple[str, bool | None]:
+        async with semaphore:
+            return zone_id, await async_probe_image(
+                session, f"{api_url}/spc/image/{zone_id}"
+            )
+
+    return dict(await asyncio.gather(*(probe(zone_id) for zone_id in zone_ids)))
+
+
+@callback
+def _async_remove_stale_cameras(
+    hass: HomeAssistant, entry: ConfigEntry, panel: SpcPanel, keep: set[str]
+) -> None:
+    """Remove camera registry entries of zones known to have no image."""
+    registry = er.async_get(hass)
+    prefix = panel.unique_id("camera_")
+    for entity_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
+        if (
+            entity_entry.domain == "camera"
+            and entity_entry.unique_id.startswith(prefix)
+            and entity_entry.unique_id.removeprefix(prefix) not in keep
+        ):
+            registry.async_remove(entity_entry.entity_id)
+            _LOGGER.debug("Removed stale camera %s", entity_entry.entity_id)
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
-    """Set up SPC cameras."""
-    api = hass.data[DATA_API]
-    api_ip = entry.data[CONF_API_URL].split("//")[-1].split("/")[0]
+    """Set up SPC cameras for the zones that have verification imaging."""
+    runtime: SpcRuntimeData = get_runtime(hass, entry.entry_id)
+    api = runtime.api
+    session = runtime.pool.session
+    cameras: dict[str, SpcCamera] = {}
+    resizer = ResizeCache(hass)
+    if DATA_CAMERAS not in hass.data:
+        hass.data[DATA_CAMERAS] = {}
+        hass.http.register_view(TimelineView(hass.data[DATA_CAMERAS]))
+        hass.http.register_view(SnapshotView(hass.data[DATA_CAMERAS]))
 
-    # Test creating a single camera regardless of verification zones
-    cameras = []
+    def burst_directory(zone_id: str) -> str | None:
+        """Return where bursts of a zone are saved, if saving is enabled."""
+        if not entry.options.get(CONF_BURST_TO_DISK, False):
+            return None
+        return hass.config.path(DOMAIN, "bursts", runtime.panel.serial, zone_id)
     _LOGGER.debug("Setting up SPC cameras with API URL: %s", api._api_url)
-    
-    # Add a camera for each zone ID (1-8 typically for SPC panels)
-    for zone_id in range(1, 9):
-        camera = SpcCamera(
-            zone_id=zone_id,
-            name=f"SPC Camera {zone_id}",
-            api_ip=api_ip,
-            api_url=api._api_url
+
+    unsub_retry: list[Callable[[], None]] = []
+
+    async def async_discover() -> None:
+        """Probe zones in parallel and sync cameras with the ones that have images."""
+        async_cancel_retry()
+        # Zones removed, or rebuilt after moving to another area; a rebuilt
+        # zone's camera keeps its registry entry for the replacement
+        for zone_id in [
+            zone_id
+            for zone_id, camera in cameras.items()
+            if api.zones.get(zone_id) is not camera._zone
+        ]:
+            camera = cameras.pop(zone_id)
+            if zone_id in api.zones:
+                await camera.async_remove(force_remove=True)
+            else:
+                await async_remove_entity(hass, camera)
+            _LOGGER.debug("Removed camera for zone %s", zone_id)
+
+        ttl = entry.options.get(CONF_SNAPSHOT_TTL, DEFAULT_SNAPSHOT_TTL)
+        fps = entry.options.get(CONF_STREAM_FPS, DEFAULT_STREAM_FPS)
+        perceptual = entry.options.get(CONF_PERCEPTUAL_HASH, False)
+        probed = await _async_probe(
+            session,
+            api._api_url,
+            [zone_id for zone_id in api.zones if zone_id not in cameras],
+        )
+        caches = {
+            zone_id: SnapshotCache(
+                hass, session, f"{api._api_url}/spc/image/{zone_id}", ttl, perceptual
+            )
+            for zone_id, has_image in probed.items()
+            if has_image
+        }
+        new_cameras = [
+            SpcCamera(
+                zone=api.zones[zone_id],
+                name=f"SPC Camera {zone_id}",
+                panel=runtime.panel,
+                api_url=api._api_url,
+                snapshots=caches[zone_id],
+                resizer=resizer,
+                mjpeg=MjpegFanout(hass, caches[zone_id], fps),
+                recorder=BurstRecorder(
+                    hass, caches[zone_id], burst_directory(zone_id)
+                ),
+            )
+            for zone_id in caches
+        ]
+
+        if new_cameras:
+            cameras.update((camera.zone_id, camera) for camera in new_cameras)
+            async_add_entities(new_cameras)
+            _LOGGER.info("Added %s SPC cameras", len(new_cameras))
+
+        failed = [zone_id for zone_id, has_image in probed.items() if has_image is None]
+        _async_remove_stale_cameras(
+            hass, entry, runtime.panel, set(cameras).union(failed)
         )
-        cameras.append(camera)
-        _LOGGER.debug("Added camera for zone %s", zone_id)
+        if failed:
+            _LOGGER.debug("Probing zones %s failed, retrying later", failed)
+            unsub_retry.append(
+                async_call_later(hass, PROBE_RETRY, async_retry_discovery)
+            )
 
-    if cameras:
-        async_add_entities(cameras)
-        _LOGGER.info("Added %s SPC cameras", len(cameras))
+        # Remembered so the platform is skipped on panels without imaging; an
+        # empty list is only stored once every zone answered the probe
+        if cameras or not failed:
+            runtime.warm_start.async_update(SOURCE_CAMERAS, sorted(cameras))
+
+    @callback
+    def async_cancel_retry() -> None:
+        """Cancel a pending re-probe."""
+        while unsub_retry:
+            unsub_retry.pop()()
+
+    @callback
+    def async_retry_discovery(_now=None) -> None:
+        """Probe the zones again whose probe failed."""
+        unsub_retry.clear()
+        entry.async_create_background_task(
+            hass, async_discover(), "acre_intrusion camera discovery retry"
+        )
+
+    async def async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Apply changed camera options to the running cameras."""
+        ttl = entry.options.get(CONF_SNAPSHOT_TTL, DEFAULT_SNAPSHOT_TTL)
+        fps = entry.options.get(CONF_STREAM_FPS, DEFAULT_STREAM_FPS)
+        perceptual = entry.options.get(CONF_PERCEPTUAL_HASH, False)
+        for camera in cameras.values():
+            camera.snapshots.ttl = ttl
+            camera.snapshots.perceptual = perceptual
+            camera.mjpeg.fps = fps
+            camera.recorder.directory = burst_directory(camera.zone_id)
+
+    async def async_discover_deferred() -> None:
+        """Discover cameras after the rest of the integration is up."""
+        await async_discover()
+        runtime.record_timing("cameras_discovered")
+
+    entry.async_create_background_task(
+        hass, async_discover_deferred(), "acre_intrusion camera discovery"
+    )
+    entry.async_on_unload(entry.add_update_listener(async_options_updated))
+    entry.async_on_unload(async_cancel_retry)
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_TOPOLOGY_UPDATED.format(entry.entry_id), async_discover
+        )
+    )
 
 class SpcCamera(Camera):
     """SPC camera."""
 
-    def __init__(self, zone_id: int, name: str, api_ip: str, api_url: str) -> None:
+    def __init__(
+        self,
+        zone: Zone,
+        name: str,
+        panel: SpcPanel,
+        api_url: str,
+        snapshots: SnapshotCache,
+        resizer: ResizeCache,
+        mjpeg: MjpegFanout,
+        recorder: BurstRecorder,
+    ) -> None:
         """Initialize the camera."""
         super().__init__()
-        self._zone_id = zone_id
+        self._zone = zone
+        self.zone_id = zone.id
+        self._zone_status = zone.status
         self._attr_name = name
-        self._attr_unique_id = f"acre_intrusion_camera_{zone_id}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, api_ip)},
-            "name": f"SPC Panel ({api_ip})",
-            "manufacturer": "Vanderbilt",
-            "model": "SPC Controller",
-        }
-        self._last_image = None
+        self._panel = panel
+        self._attr_unique_id = panel.unique_id(f"camera_{zone.id}")
+        self._attr_device_info = panel.device_info("SPC Controller")
         self._api_url = api_url
-        self._session = None
+        self.snapshots = snapshots
+        self._resizer = resizer
+        self.mjpeg = mjpeg
+        self.recorder = recorder
         _LOGGER.debug("Initialized camera %s with API URL: %s", self._attr_name, self._api_url)
 
+    async def async_added_to_hass(self) -> None:
+        """Register the camera with its views and watch the zone for alarms."""
+        registered = self.hass.data[DATA_CAMERAS]
+        registered[self.entity_id] = self
+        self.async_on_remove(lambda: registered.pop(self.entity_id, None))
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_UPDATE_SENSOR.format(self._panel.entry_id, self.zone_id),
+                self._zone_callback,
+            )
+        )
+
+    @callback
+    def _zone_callback(self) -> None:
+        """Capture a burst when the zone goes into alarm."""
+        status = self._zone.status
+        if status == ZoneStatus.ALARM and self._zone_status != ZoneStatus.ALARM:
+            _LOGGER.debug("Zone %s in alarm, capturing images", self.zone_id)
+            self.recorder.async_trigger()
+            self.async_write_ha_state()
+        self._zone_status = status
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop streaming and capturing when the camera is removed."""
+        self.mjpeg.async_stop()
+        self.recorder.async_stop()
+
     @property
-    def supported_features(self) -> CameraEntityFeature:
-        """Return supported features."""
-        return CameraEntityFeature.STREAM
+    def extra_state_attributes(self) -> dict[str, str | int | None]:
+        """Return image change and timeline details."""
+        last_burst = self.recorder.last_burst
+        last_changed = self.snapshots.last_changed
+        return {
+            "snapshot_url": f"/api/acre_intrusion/snapshot/{self.entity_id}",
+            "image_last_changed": last_changed.isoformat() if last_changed else None,
+            "timeline_url": f"/api/acre_intrusion/timeline/{self.entity_id}",
+            "timeline_frames": self.recorder.frame_count,
+            "last_burst": last_burst.isoformat() if last_burst else None,
+        }
+
+    async def handle_async_mjpeg_stream(
+        self, request: web.Request
+    ) -> web.StreamResponse:
+        """Serve an MJPEG stream fed by the shared snapshot poller."""
+        response = web.StreamResponse()
+        response.content_type = f"multipart/x-mixed-replace;boundary={MJPEG_BOUNDARY}"
+        await response.prepare(request)
 
-    async def async_stream_source(self) -> str | None:
-        """Return stream source URL."""
-        return f"{self._api_url}/spc/image/{self._zone_id}"
+        queue = self.mjpeg.async_subscribe()
+        try:
+            while True:
+                await response.write(mjpeg_part(await queue.get()))
+        except ConnectionResetError:
+            pass
+        finally:
+            self.mjpeg.async_unsubscribe(queue)
+        return response
 
     async def async_camera_image(
         self, width: int | None = None, height: int | None = None
     ) -> bytes | None:
-        """Return image response."""
-        try:
-            url = f"{self._api_url}/spc/image/{self._zone_id}"
-            _LOGGER.debug("Fetching camera image from: %s", url)
-            
-            if self._session is None:
-                self._session = aiohttp_client.async_get_clientsession(self.hass)
-            
-            async with self._session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    if (data.get("status") == "success" and 
-                        "data" in data and 
-                        "image" in data["data"] and 
-                        "data" in data["data"]["image"]):
-                        
-                        image_data = data["data"]["image"]["data"]
-                        decoded_image = base64.b64decode(image_data)
-                        self._last_image = decoded_image
-                        return decoded_image
-            
-            return self._last_image
-                            
-        except Exception as err:
-            _LOGGER.error("Error getting camera image: %s", err)
-            return self._last_image
+        """Return image response, downscaled if a size was requested."""
+        frame = await self.snapshots.async_get_frame()
+        if frame is None:
+            return None
+        version, image = frame
+        if width is None and height is None:
+            return image
+        return await self._resizer.async_get(self.zone_id, version, image, width, height)
@@ -0,0 +1,146 @@
+"""Command serialization for acre Intrusion."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+import logging
+from typing import Any
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+TRANSIENT_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError)
+COMMAND_RETRIES = 3
+COMMAND_BACKOFF = 0.5  # seconds, doubled on every retry
+
+
+@dataclass
+class _Command:
+    """A command waiting for, or being sent to, the gateway."""
+
+    key: Hashable
+    group: str
+    factory: Callable[[], Awaitable[Any]]
+    future: asyncio.Future = field(repr=False)
+
+
+class CommandQueue:
+    """Serialize gateway commands per target object.
+
+    Commands for the same target run one at a time in submission order. A
+    command identical to one already pending joins it instead of queueing a
+    duplicate, and a later command in the same group (for example disarm
+    after arm) supersedes any pending command of that group. Transient
+    gateway failures are retried with exponential backoff; pyspcwebgw reports
+    those by returning False, so that result is retried as well.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        retries: int = COMMAND_RETRIES,
+        backoff: float = COMMAND_BACKOFF,
+    ) -> None:
+        """Initialize the queue."""
+        self.hass = hass
+        self._retries = retries
+        self._backoff = backoff
+        self._pending: dict[Hashable, list[_Command]] = {}
+        self._running: dict[Hashable, _Command] = {}
+        self._workers: dict[Hashable, asyncio.Task] = {}
+
+    async def async_submit(
+        self,
+        target: Hashable,
+        key: Hashable,
+        factory: Callable[[], Awaitable[Any]],
+        group: str = "default",
+    ) -> Any:
+        """Queue a command for target and wait for its result."""
+        pending = self._pending.setdefault(target, [])
+        for command in pending:
+            if command.key == key:
+                return await asyncio.shield(command.future)
+
+        for command in [command for command in pending if command.group == group]:
+            _LOGGER.debug("Command %s for %s superseded by %s", command.key, target, key)
+            pending.remove(command)
+            command.future.set_result(None)
+
+        running = self._running.get(target)
+        if running is not None and running.key == key:
+            return await asyncio.shield(running.future)
+
+        command = _Command(key, group, factory, self.hass.loop.create_future())
+        pending.append(command)
+        if target not in self._workers:
+            self._workers[target] = self.hass.async_create_background_task(
+                self._async_run(target), f"acre_intrusion command queue {target}"
+            )
+        return await asyncio.shield(command.future)
+
+    async def _async_run(self, target: Hashable) -> None:
+        """Send the pending commands of a target one by one."""
+        pending = self._pending[target]
+        try:
+            while pending:
+                command = pending.pop(0)
+                self._running[target] = command
+                try:
+                    result = await self._async_execute(command)
+                except asyncio.CancelledError:
+                    command.future.cancel()
+                    raise
+                except Exception as err:  # noqa: BLE001
+                    command.future.set_exception(err)
+                else:
+                    command.future.set_result(result)
+                finally:
+                    self._running.pop(target, None)
+        finally:
+            self._workers.pop(target, None)
+            if not pending:
+                self._pending.pop(target, None)
+
+    async def _async_execute(self, command: _Command) -> Any:
+        """Send a command, retrying transient failures with backoff.
+
+        Returns False if the gateway still refused the command after the last
+        retry.
+        """
+        attempt = 0
+        while True:
+            try:
+                result = await command.factory()
+            except TRANSIENT_ERRORS as err:
+                if attempt >= self._retries:
+                    raise
+                reason: Any = err
+            else:
+                if result is not False or attempt >= self._retries:
+                    return result
+                reason = "rejected"
+            delay = self._backoff * 2**attempt
+            attempt += 1
+            _LOGGER.debug(
+                "Command %s failed (%s), retry %s in %.1fs",
+                command.key,
+                reason,
+                attempt,
+                delay,
+            )
+            await asyncio.sleep(delay)
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel every queued and running command."""
+        for pending in self._pending.values():
+            for command in pending:
+                command.future.cancel()
+            pending.clear()
+        for worker in self._workers.values():
+            worker.cancel()
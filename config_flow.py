@@ -1,29 +1,40 @@
 """Config flow for acre Intrusion integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from typing import Any
 
-from pyspcwebgw import SpcWebGateway
+import aiohttp
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
-from homeassistant.helpers import aiohttp_client
 
 from .const import (
+    DATA_PROBED_PANELS,
     DOMAIN,
     CONF_WS_URL,
     CONF_API_URL,
     CONF_USERNAME,
     CONF_PIN,
     CONF_ADMIN_PIN,
+    CONF_BURST_TO_DISK,
+    CONF_PERCEPTUAL_HASH,
+    CONF_SNAPSHOT_TTL,
+    CONF_STREAM_FPS,
+    DEFAULT_SNAPSHOT_TTL,
+    DEFAULT_STREAM_FPS,
 )
+from .pool import GatewayPool
 from .storage import PinStorage
 
 _LOGGER = logging.getLogger(__name__)
 
+PROBE_TIMEOUT = 5  # seconds, per endpoint
+
 DATA_SCHEMA = vol.Schema({
     vol.Required(CONF_WS_URL): str,
     vol.Required(CONF_API_URL): str,
@@ -38,6 +49,42 @@ USER_DATA_SCHEMA = vol.Schema({
     vol.Required(CONF_PIN): str,
 })
 
+async def _async_probe_api(
+    session: aiohttp.ClientSession, api_url: str
+) -> tuple[dict[str, Any], float]:
+    """Read the panel details from the REST API and time the request."""
+    started = time.monotonic()
+    async with asyncio.timeout(PROBE_TIMEOUT):
+        async with session.get(f"{api_url}/spc/panel") as resp:
+            resp.raise_for_status()
+            payload = await resp.json()
+    latency = time.monotonic() - started
+    if not isinstance(payload, dict) or payload.get("status") != "success":
+        raise aiohttp.ClientPayloadError("Gateway did not return the panel")
+    panel = payload.get("data", {}).get("panel")
+    if not isinstance(panel, dict):
+        raise aiohttp.ClientPayloadError("Gateway did not return the panel")
+    return panel, latency
+
+
+async def _async_probe_websocket(session: aiohttp.ClientSession, ws_url: str) -> float:
+    """Open and close the websocket and time the handshake."""
+    started = time.monotonic()
+    async with asyncio.timeout(PROBE_TIMEOUT):
+        async with session.ws_connect(ws_url) as ws:
+            latency = time.monotonic() - started
+            await ws.close()
+    return latency
+
+
+def _probe_error(err: BaseException) -> str:
+    """Return the form error for a failed probe."""
+    if isinstance(err, (aiohttp.ClientError, TimeoutError)):
+        return "cannot_connect"
+    _LOGGER.error("Unexpected error probing the SPC gateway", exc_info=err)
+    return "unknown"
+
+
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for acre Intrusion."""
 
@@ -54,31 +101,46 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self):
         """Initialize the config flow."""
         self._config = {}
+        self._probe: dict[str, str] = {}
+        self._panel: dict[str, Any] | None = None
 
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Handle the initial step - API configuration."""
         errors = {}
 
         if user_input is not None:
+            # Probe both endpoints at once on a short-lived pool of its own
+            pool = GatewayPool(self.hass, limit=2)
             try:
-                # Test connection
-                session = aiohttp_client.async_get_clientsession(self.hass)
-                spc = SpcWebGateway(
-                    loop=self.hass.loop,
-                    session=session,
-                    api_url=user_input[CONF_API_URL],
-                    ws_url=user_input[CONF_WS_URL],
-                    async_callback=None,
+                api_result, ws_result = await asyncio.gather(
+                    _async_probe_api(pool.session, user_input[CONF_API_URL]),
+                    _async_probe_websocket(pool.session, user_input[CONF_WS_URL]),
+                    return_exceptions=True,
                 )
-
-                if await spc.async_load_parameters():
-                    self._config.update(user_input)
-                    # Proceed to admin PIN setup
-                    return await self.async_step_admin_setup()
-                else:
-                    errors["base"] = "cannot_connect"
-            except Exception:
-                errors["base"] = "unknown"
+            finally:
+                await pool.async_close()
+
+            if isinstance(api_result, BaseException):
+                errors[CONF_API_URL] = _probe_error(api_result)
+            if isinstance(ws_result, BaseException):
+                errors[CONF_WS_URL] = _probe_error(ws_result)
+
+            if not errors:
+                panel, api_latency = api_result
+                if serial := panel.get("sn"):
+                    await self.async_set_unique_id(str(serial))
+                    self._abort_if_unique_id_configured()
+                self._config.update(user_input)
+                self._panel = panel
+                self._probe = {
+                    "serial": str(serial or "unknown"),
+                    "variant": str(panel.get("variant") or "SPC"),
+                    "api_latency": f"{api_latency * 1000:.0f}",
+                    "ws_latency": f"{ws_result * 1000:.0f}",
+                }
+                _LOGGER.debug("Probed SPC gateway: %s", self._probe)
+                # Proceed to admin PIN setup
+                return await self.async_step_admin_setup()
 
         return self.async_show_form(
             step_id="user",
@@ -95,9 +157,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             pin = user_input[CONF_ADMIN_PIN]
             if len(pin) == 6 and pin.isdigit():
-                pin_storage = PinStorage(self.hass)
-                await pin_storage.async_load()
-                await pin_storage.async_store_admin_pin(pin)
+                # The entry id keys the PIN store, so the hashed PIN is handed
+                # to the first setup, which moves it into the store
+                self._config[CONF_ADMIN_PIN] = PinStorage.admin_pin_record(pin)
+                if self._panel is not None:
+                    # Handed to the first setup so it does not read them again
+                    self.hass.data.setdefault(DATA_PROBED_PANELS, {})[
+                        self._config[CONF_API_URL]
+                    ] = self._panel
                 return self.async_create_entry(
                     title="Acre Intrusion",
                     data=self._config
@@ -109,6 +176,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="admin_setup",
             data_schema=PIN_DATA_SCHEMA,
             errors=errors,
+            description_placeholders=self._probe,
         )
 
 class OptionsFlowHandler(config_entries.OptionsFlow):
@@ -127,7 +195,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             return await self.async_step_menu()
 
         errors = {}
-        pin_storage = PinStorage(self.hass)
+        pin_storage = PinStorage(self.hass, self.config_entry.entry_id)
         await pin_storage.async_load()
 
         if user_input is not None:
@@ -148,7 +216,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Show menu for managing users and PINs."""
-        pin_storage = PinStorage(self.hass)
+        pin_storage = PinStorage(self.hass, self.config_entry.entry_id)
         await pin_storage.async_load()
         users = pin_storage.get_users()
         user_list = [user for user in users if user != 'admin']
@@ -164,9 +232,13 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 return await self.async_step_remove_user()
             elif action == "change_admin":
                 return await self.async_step_change_admin()
+            elif action == "camera_settings":
+                return await self.async_step_camera_settings()
             elif action == "exit":
                 self._admin_verified = False
-                return self.async_create_entry(title="", data={})
+                return self.async_create_entry(
+                    title="", data=dict(self.config_entry.options)
+                )
 
         return self.async_show_form(
             step_id="menu",
@@ -176,6 +248,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     "modify_user": "Modify existing user" if user_list else "No users to modify",
                     "remove_user": "Remove user" if user_list else "No users to remove",
                     "change_admin": "Change admin PIN",
+                    "camera_settings": "Camera settings",
                     "exit": "Exit menu"
                 }),
             }),
@@ -193,7 +266,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         if user_input is not None:
             pin = user_input[CONF_PIN]
             if len(pin) == 6 and pin.isdigit():
-                pin_storage = PinStorage(self.hass)
+                pin_storage = PinStorage(self.hass, self.config_entry.entry_id)
                 await pin_storage.async_load()
                 await pin_storage.async_store_pin(user_input[CONF_USERNAME], pin)
                 if user_input.get("add_another"):
@@ -215,7 +288,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Select user to modify."""
-        pin_storage = PinStorage(self.hass)
+        pin_storage = PinStorage(self.hass, self.config_entry.entry_id)
         await pin_storage.async_load()
         users = pin_storage.get_user_pins()
 
@@ -241,7 +314,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         if user_input is not None:
             pin = user_input[CONF_PIN]
             if len(pin) == 6 and pin.isdigit():
-                pin_storage = PinStorage(self.hass)
+                pin_storage = PinStorage(self.hass, self.config_entry.entry_id)
                 await pin_storage.async_load()
                 await pin_storage.async_store_pin(username, pin)
                 return await self.async_step_menu()
@@ -260,7 +333,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Remove a user."""
-        pin_storage = PinStorage(self.hass)
+        pin_storage = PinStorage(self.hass, self.config_entry.entry_id)
         await pin_storage.async_load()
         users = pin_storage.get_user_pins()
 
@@ -291,7 +364,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         if user_input is not None:
             pin = user_input[CONF_ADMIN_PIN]
             if len(pin) == 6 and pin.isdigit():
-                pin_storage = PinStorage(self.hass)
+                pin_storage = PinStorage(self.hass, self.config_entry.entry_id)
                 await pin_storage.async_load()
                 await pin_storage.async_store_admin_pin(pin)
                 return await self.async_step_menu()
@@ -305,5 +378,37 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             errors=errors,
         )
 
+    async def async_step_camera_settings(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Configure camera snapshot caching and streaming."""
+        if user_input is not None:
+            return self.async_create_entry(
+                title="", data={**self.config_entry.options, **user_input}
+            )
+
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id="camera_settings",
+            data_schema=vol.Schema({
+                vol.Required(
+                    CONF_SNAPSHOT_TTL,
+                    default=options.get(CONF_SNAPSHOT_TTL, DEFAULT_SNAPSHOT_TTL),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=300)),
+                vol.Required(
+                    CONF_STREAM_FPS,
+                    default=options.get(CONF_STREAM_FPS, DEFAULT_STREAM_FPS),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=10)),
+                vol.Required(
+                    CONF_BURST_TO_DISK,
+                    default=options.get(CONF_BURST_TO_DISK, False),
+                ): bool,
+                vol.Required(
+                    CONF_PERCEPTUAL_HASH,
+                    default=options.get(CONF_PERCEPTUAL_HASH, False),
+                ): bool,
+            }),
+        )
+
 class CannotConnect(Exception):
     """Error to indicate we cannot connect."""
@@ -0,0 +1,155 @@
+"""Websocket connection supervision for acre Intrusion."""
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+import logging
+import random
+import time
+
+from pyspcwebgw import SpcWebGateway
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.util import dt as dt_util
+
+from .const import SIGNAL_CONNECTION_UPDATED
+
+_LOGGER = logging.getLogger(__name__)
+
+WATCH_INTERVAL = timedelta(seconds=5)
+BACKOFF_MIN = 1.0  # seconds
+BACKOFF_MAX = 300.0  # seconds
+
+# States of the pyspcwebgw websocket client
+STATE_STARTING = "starting"
+STATE_RUNNING = "running"
+
+
+def backoff_delay(failures: int) -> float:
+    """Return a jittered, exponentially growing reconnect delay.
+
+    The delay is drawn from the upper half of the capped exponential, so
+    gateways that drop together do not reconnect in lockstep.
+    """
+    ceiling = min(BACKOFF_MAX, BACKOFF_MIN * 2**failures)
+    return random.uniform(ceiling / 2, ceiling)
+
+
+class ConnectionSupervisor:
+    """Keep the gateway websocket connected and resync after reconnects.
+
+    The client's fixed retry timer is replaced by a jittered exponential
+    backoff. Once a dropped connection is back, only area and zone states
+    are re-read and the objects that changed meanwhile are reported.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        api: SpcWebGateway,
+        async_resync: Callable[[], Awaitable[int]],
+    ) -> None:
+        """Initialize the supervisor."""
+        self.hass = hass
+        self._entry = entry
+        self._api = api
+        self._async_resync = async_resync
+        self.connected_since: datetime | None = None
+        self.reconnects = 0
+        self.last_resync_duration: float | None = None
+        self._failures = 0
+        self._was_connected = False
+        self._unsub_watch: CALLBACK_TYPE | None = None
+        self._unsub_retry: CALLBACK_TYPE | None = None
+
+    @property
+    def connected(self) -> bool:
+        """Return true while the websocket is connected."""
+        return self.connected_since is not None
+
+    @callback
+    def async_start(self) -> None:
+        """Connect the websocket and start watching it."""
+        self._api.start()
+        self._api._websocket.retry = self._async_schedule_retry
+        self._unsub_watch = async_track_time_interval(
+            self.hass, self._async_watch, WATCH_INTERVAL
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop watching and close the websocket."""
+        if self._unsub_watch is not None:
+            self._unsub_watch()
+            self._unsub_watch = None
+        if self._unsub_retry is not None:
+            self._unsub_retry()
+            self._unsub_retry = None
+        self._api.stop()
+
+    @callback
+    def _async_schedule_retry(self) -> None:
+        """Reconnect after a backoff; called by the client when it drops."""
+        self._api._websocket.state = STATE_STARTING
+        self._async_set_disconnected()
+        delay = backoff_delay(self._failures)
+        self._failures += 1
+        _LOGGER.debug("Reconnecting websocket in %.1fs", delay)
+        self._unsub_retry = async_call_later(self.hass, delay, self._async_retry)
+
+    @callback
+    def _async_retry(self, now=None) -> None:
+        """Start a new connection attempt."""
+        self._unsub_retry = None
+        self._api._websocket.start()
+
+    @callback
+    def _async_watch(self, now=None) -> None:
+        """Notice the connection coming up or going away."""
+        if self._api._websocket.state != STATE_RUNNING:
+            self._async_set_disconnected()
+            return
+        if self.connected:
+            return
+        self.connected_since = dt_util.utcnow()
+        self._failures = 0
+        if self._was_connected:
+            self.reconnects += 1
+            _LOGGER.info("Websocket to SPC panel reconnected")
+            self._entry.async_create_background_task(
+                self.hass, self._async_run_resync(), "acre_intrusion resync"
+            )
+        self._was_connected = True
+        self._async_notify()
+
+    @callback
+    def _async_set_disconnected(self) -> None:
+        """Record a dropped connection."""
+        if not self.connected:
+            return
+        _LOGGER.warning("Websocket to SPC panel lost")
+        self.connected_since = None
+        self._async_notify()
+
+    async def _async_run_resync(self) -> None:
+        """Re-read the states missed while disconnected."""
+        started = time.monotonic()
+        changed = await self._async_resync()
+        self.last_resync_duration = round(time.monotonic() - started, 3)
+        _LOGGER.debug(
+            "Resync found %s changed objects in %.3fs",
+            changed,
+            self.last_resync_duration,
+        )
+        self._async_notify()
+
+    @callback
+    def _async_notify(self) -> None:
+        """Tell listeners the connection details changed."""
+        async_dispatcher_send(
+            self.hass, SIGNAL_CONNECTION_UPDATED.format(self._entry.entry_id)
+        )
@@ -2,15 +2,46 @@
 
 DOMAIN = "acre_intrusion"
 DATA_API = "acre_intrusion_api"
+DATA_CAMERAS = "acre_intrusion_cameras"
+DATA_PROBED_PANELS = "acre_intrusion_probed_panels"
 CONF_WS_URL = "ws_url"
 CONF_API_URL = "api_url"
 CONF_USERNAME = "username"
 CONF_PIN = "pin"
 CONF_ADMIN_PIN = "admin_pin"
 CONF_USERS = "users"
+CONF_SNAPSHOT_TTL = "snapshot_ttl"
+CONF_STREAM_FPS = "stream_fps"
+CONF_BURST_TO_DISK = "burst_to_disk"
+CONF_PERCEPTUAL_HASH = "perceptual_hash"
 
-SIGNAL_UPDATE_ALARM = "acre_intrusion_update_alarm_{}"
-SIGNAL_UPDATE_SENSOR = "acre_intrusion_update_sensor_{}"
+DEFAULT_SNAPSHOT_TTL = 5  # seconds
+DEFAULT_STREAM_FPS = 1.0
 
-STORAGE_KEY = "acre_intrusion_pins"
+SIGNAL_UPDATE_ALARM = "acre_intrusion_update_alarm_{}_{}"
+SIGNAL_UPDATE_SENSOR = "acre_intrusion_update_sensor_{}_{}"
+SIGNAL_UPDATE_ALERT = "acre_intrusion_update_alert_{}_{}"
+SIGNAL_UPDATE_DOOR = "acre_intrusion_update_door_{}_{}"
+SIGNAL_UPDATE_WIRELESS = "acre_intrusion_update_wireless_{}_{}"
+SIGNAL_UPDATE_AREA_ACTIVITY = "acre_intrusion_update_area_activity_{}_{}"
+SIGNAL_PANEL_CONFIG_CHANGED = "acre_intrusion_panel_config_changed_{}"
+SIGNAL_TOPOLOGY_UPDATED = "acre_intrusion_topology_updated_{}"
+SIGNAL_WARM_START_FRESH = "acre_intrusion_warm_start_fresh_{}_{}"
+SIGNAL_CONNECTION_UPDATED = "acre_intrusion_connection_updated_{}"
+
+SERVICE_SET_OUTPUTS = "set_outputs"
+SERVICE_LOCK_DOORS = "lock_doors"
+SERVICE_UNLOCK_DOORS = "unlock_doors"
+ATTR_STATE = "state"
+
+STORAGE_KEY = "acre_intrusion_pins"  # shared by all entries in older releases
+STORAGE_KEY_ENTRY = "acre_intrusion_pins_{}"
 STORAGE_VERSION = 1
+SNAPSHOT_STORAGE_KEY = "acre_intrusion_snapshot_{}"
+SNAPSHOT_STORAGE_VERSION = 1
+
+# Warm-start snapshot sources
+SOURCE_TOPOLOGY = "topology"
+SOURCE_SENSOR = "sensor"
+SOURCE_OUTPUTS = "outputs"
+SOURCE_CAMERAS = "cameras"
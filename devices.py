@@ -0,0 +1,123 @@
+"""Door and wireless device tracking for acre Intrusion."""
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from typing import Any
+
+import aiohttp
+
+from pyspcwebgw import SpcWebGateway
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import SIGNAL_UPDATE_DOOR, SIGNAL_UPDATE_WIRELESS
+from .runtime import jittered
+
+_LOGGER = logging.getLogger(__name__)
+
+POLL_INTERVAL = timedelta(seconds=10)
+
+DOOR_FIELDS = ("status", "mode")
+WIRELESS_FIELDS = ("signal", "battery", "status")
+
+
+def _coerce(value: Any) -> Any:
+    """Return numeric strings from the gateway as integers."""
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return value
+
+
+class DevicePoller:
+    """Keep door and wireless objects current.
+
+    Updates pushed over the websocket are routed straight to the entities. For
+    devices the gateway does not push, a targeted poll of the door and wireless
+    endpoints patches only the fields that changed and notifies only the
+    affected entities.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: SpcWebGateway,
+        session: aiohttp.ClientSession,
+        entry_id: str,
+    ) -> None:
+        """Initialize the poller."""
+        self.hass = hass
+        self._entry_id = entry_id
+        self._api = api
+        self._session = session
+        self._unsub: CALLBACK_TYPE | None = None
+        self._kinds: list[tuple[str, dict, tuple[str, ...], str]] = []
+        if hasattr(api, "doors"):
+            self._kinds.append(("door", api.doors, DOOR_FIELDS, SIGNAL_UPDATE_DOOR))
+        if hasattr(api, "wireless_sensors"):
+            self._kinds.append(
+                ("wireless", api.wireless_sensors, WIRELESS_FIELDS, SIGNAL_UPDATE_WIRELESS)
+            )
+
+    @callback
+    def async_start(self) -> None:
+        """Start the targeted poll."""
+        if self._kinds and self._unsub is None:
+            self._unsub = async_track_time_interval(
+                self.hass, self._async_poll, jittered(POLL_INTERVAL)
+            )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop the targeted poll."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def async_pushed(self, spc_object: Any) -> bool:
+        """Dispatch a pushed door or wireless object, if it is one."""
+        object_id = getattr(spc_object, "id", None)
+        for _, objects, _, signal in self._kinds:
+            if objects.get(object_id) is spc_object:
+                async_dispatcher_send(
+                    self.hass, signal.format(self._entry_id, object_id)
+                )
+                return True
+        return False
+
+    async def _async_poll(self, now=None) -> None:
+        """Fetch door and wireless state and notify changed devices."""
+        for endpoint, objects, fields, signal in self._kinds:
+            try:
+                async with self._session.get(
+                    f"{self._api._api_url}/spc/{endpoint}"
+                ) as resp:
+                    if resp.status != 200:
+                        continue
+                    payload = await resp.json()
+            except Exception as err:
+                _LOGGER.debug("Error polling %s state: %s", endpoint, err)
+                continue
+
+            if payload.get("status") != "success":
+                continue
+
+            for item in payload.get("data", {}).get(endpoint, []):
+                device = objects.get(item.get("id"))
+                if device is None:
+                    continue
+                changed = False
+                for field in fields:
+                    if field not in item:
+                        continue
+                    value = _coerce(item[field])
+                    if getattr(device, field, None) != value:
+                        setattr(device, field, value)
+                        changed = True
+                if changed:
+                    async_dispatcher_send(
+                        self.hass, signal.format(self._entry_id, device.id)
+                    )
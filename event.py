@@ -4,14 +4,13 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from pyspcwebgw import SpcWebGateway
-
 from homeassistant.components.event import EventEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from . import DATA_API
+from .const import DOMAIN
+from .runtime import SpcPanel, SpcRuntimeData, get_runtime
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,20 +18,23 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up SPC events from config entry."""
-    api: SpcWebGateway = hass.data[DATA_API]
+    runtime: SpcRuntimeData = get_runtime(hass, entry.entry_id)
+    api = runtime.api
     if hasattr(api, 'events'):
-        async_add_entities(SpcEvent(event) for event in api.events.values())
+        async_add_entities(
+            SpcEvent(event, runtime.panel) for event in api.events.values()
+        )
 
 class SpcEvent(EventEntity):
     """Representation of a SPC event."""
 
-    def __init__(self, event) -> None:
+    def __init__(self, event, panel: SpcPanel) -> None:
         """Initialize the event."""
         self._event = event
         self._attr_name = event.name
-        self._attr_unique_id = f"acre_intrusion_event_{event.id}"
+        self._attr_unique_id = panel.unique_id(f"event_{event.id}")
         self._attr_device_info = {
-            "identifiers": {("acre_intrusion", f"event_{event.id}")},
+            "identifiers": {(DOMAIN, f"{panel.serial}_event_{event.id}")},
             "name": event.name,
             "manufacturer": "Vanderbilt",
             "model": "SPC Event",
@@ -4,14 +4,18 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from pyspcwebgw import SpcWebGateway
-
-from homeassistant.components.lock import LockEntity
+from homeassistant.components.lock import LockEntity, LockEntityFeature, LockState
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 
-from .const import CONF_API_URL, DATA_API, DOMAIN
+from .commands import CommandQueue
+from .const import SIGNAL_UPDATE_DOOR
+from .runtime import SpcPanel, SpcRuntimeData, get_runtime
+from .warm_start import RestoredStateEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,71 +24,221 @@ DOOR_MODE_NORMAL = 0
 DOOR_MODE_LOCKED = 1
 DOOR_MODE_BLOCKED = 2
 
+# Commands in the same group cancel each other while pending
+DOOR_COMMAND_GROUPS = {
+    "lock": "mode",
+    "set_normal_mode": "mode",
+    "open_permanently": "mode",
+    "open_momentarily": "momentary",
+    "isolate": "isolate",
+    "deisolate": "isolate",
+    "inhibit": "inhibit",
+    "deinhibit": "inhibit",
+}
+
+# Door mode a command leaves the door in, for the commands lock state tracks
+DOOR_COMMAND_MODES = {
+    "lock": DOOR_MODE_LOCKED,
+    "set_normal_mode": DOOR_MODE_NORMAL,
+}
+
+# Time for the door poll to report the new mode after the gateway acknowledged
+CONFIRM_TIMEOUT = 30  # seconds
+
+
+def door_capabilities(door) -> frozenset[str]:
+    """Return the commands a pyspcwebgw door object supports."""
+    return frozenset(
+        command
+        for command in DOOR_COMMAND_GROUPS
+        if callable(getattr(door, command, None))
+    )
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up the SPC locks."""
-    api: SpcWebGateway = hass.data[DATA_API]
-    api_ip = entry.data[CONF_API_URL].split("//")[-1].split("/")[0]  # Extract IP address from API URL
+    runtime: SpcRuntimeData = get_runtime(hass, entry.entry_id)
+    api = runtime.api
     if hasattr(api, 'doors'):
-        async_add_entities(SpcDoorLock(door, api_ip) for door in api.doors.values())
+        runtime.locks = {
+            str(door.id): SpcDoorLock(door, runtime.panel, runtime.commands)
+            for door in api.doors.values()
+        }
+        async_add_entities(runtime.locks.values())
+
+class SpcDoorLock(RestoredStateEntity, LockEntity):
+    """Representation of an SPC door lock.
+
+    Lock and unlock show the target state as soon as the gateway
+    acknowledges the command, and keep it until the door poll confirms the
+    new mode or the confirmation times out.
+    """
 
-class SpcDoorLock(LockEntity):
-    """Representation of an SPC door lock."""
+    _attr_should_poll = False
 
-    def __init__(self, door, api_ip: str) -> None:
+    def __init__(self, door, panel: SpcPanel, commands: CommandQueue | None = None) -> None:
         """Initialize the lock."""
         self._door = door
+        self._commands = commands
+        self._capabilities = door_capabilities(door)
+        self._mode: int | None = getattr(door, 'mode', None)
+        self._expected_mode: int | None = None
+        self._unsub_confirm: CALLBACK_TYPE | None = None
         self._attr_name = door.name
-        self._attr_unique_id = f"acre_intrusion_door_{door.id}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, api_ip)},
-            "name": f"SPC Panel ({api_ip})",
-            "manufacturer": "Vanderbilt",
-            "model": "SPC Door",
-        }
+        self._panel = panel
+        self._attr_unique_id = panel.unique_id(f"door_{door.id}")
+        self._attr_device_info = panel.device_info("SPC Door")
+        if "open_momentarily" in self._capabilities:
+            self._attr_supported_features = LockEntityFeature.OPEN
+
+    async def async_added_to_hass(self) -> None:
+        """Call for adding new entities."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_UPDATE_DOOR.format(self._panel.entry_id, self._door.id),
+                self._update_callback,
+            )
+        )
+        self.async_on_remove(self._async_settle)
+
+    @callback
+    def _update_callback(self) -> None:
+        """Write state if the door mode changed."""
+        mode = getattr(self._door, 'mode', None)
+        if self._expected_mode is not None:
+            # Ignore the old mode until the command shows up
+            if mode != self._expected_mode:
+                return
+            self._async_settle()
+        elif mode == self._mode:
+            return
+        self._mode = mode
+        self.async_write_ha_state()
+
+    @callback
+    def _async_settle(self) -> None:
+        """Stop waiting for a command to take effect."""
+        self._expected_mode = None
+        self._attr_is_locking = self._attr_is_unlocking = False
+        if self._unsub_confirm is not None:
+            self._unsub_confirm()
+            self._unsub_confirm = None
+
+    @callback
+    def _async_confirm_timeout(self, _now=None) -> None:
+        """Fall back to the reported mode when the command did not show up."""
+        self._unsub_confirm = None
+        _LOGGER.warning(
+            "Door %s did not report the commanded mode within %ss",
+            self._door.name,
+            CONFIRM_TIMEOUT,
+        )
+        self._async_settle()
+        self._mode = getattr(self._door, 'mode', None)
+        self.async_write_ha_state()
+
+    async def _async_send(self, command: str) -> None:
+        """Send a door command through the per-door command queue."""
+        if command not in self._capabilities:
+            raise HomeAssistantError(f"{self._door.name} does not support {command}")
+        method = getattr(self._door, command)
+
+        expected = DOOR_COMMAND_MODES.get(command)
+        if expected is not None:
+            self._async_settle()
+            self._expected_mode = expected
+            self._attr_is_locking = expected == DOOR_MODE_LOCKED
+            self._attr_is_unlocking = expected != DOOR_MODE_LOCKED
+            self.async_write_ha_state()
+
+        try:
+            if self._commands is None:
+                result = await method()
+            else:
+                result = await self._commands.async_submit(
+                    ("door", self._door.id),
+                    command,
+                    method,
+                    group=DOOR_COMMAND_GROUPS[command],
+                )
+        except Exception as err:
+            self._async_command_failed(expected)
+            raise HomeAssistantError(
+                f"Failed to {command} {self._door.name}: {err}"
+            ) from err
+        if result is False:
+            self._async_command_failed(expected)
+            raise HomeAssistantError(f"{self._door.name} rejected {command}")
+
+        # Superseded by a later command, which tracks the state from here
+        if expected is None or self._expected_mode != expected:
+            return
+        self._attr_is_locking = self._attr_is_unlocking = False
+        if getattr(self._door, 'mode', None) == expected:
+            self._async_settle()
+        else:
+            self._unsub_confirm = async_call_later(
+                self.hass, CONFIRM_TIMEOUT, self._async_confirm_timeout
+            )
+        self._mode = expected
+        self.async_write_ha_state()
+
+    @callback
+    def _async_command_failed(self, expected: int | None) -> None:
+        """Drop the pending state of a failed command."""
+        if expected is not None and self._expected_mode == expected:
+            self._async_settle()
+            self.async_write_ha_state()
+
+    @property
+    def _has_live_state(self) -> bool:
+        """Return true once the door reported its mode."""
+        return self._mode is not None
 
     @property
-    def is_locked(self) -> bool:
+    def is_locked(self) -> bool | None:
         """Return true if the lock is locked."""
-        return getattr(self._door, 'mode', 0) == 1  # 1 = Locked
+        if self._mode is None:
+            if self._restored_state is None:
+                return None
+            return self._restored_state == LockState.LOCKED
+        return self._mode == DOOR_MODE_LOCKED
 
     async def async_lock(self, **kwargs: Any) -> None:
         """Lock the door."""
-        if hasattr(self._door, 'lock'):
-            await self._door.lock()
+        await self._async_send("lock")
 
     async def async_unlock(self, **kwargs: Any) -> None:
         """Unlock the door."""
-        if hasattr(self._door, 'set_normal_mode'):
-            await self._door.set_normal_mode()
+        await self._async_send("set_normal_mode")
+
+    async def async_open(self, **kwargs: Any) -> None:
+        """Open the door momentarily."""
+        await self._async_send("open_momentarily")
 
     async def async_open_permanently(self, **kwargs: Any) -> None:
         """Open the door permanently."""
-        if hasattr(self._door, 'open_permanently'):
-            await self._door.open_permanently()
+        await self._async_send("open_permanently")
 
     async def async_open_momentarily(self, **kwargs: Any) -> None:
         """Open the door momentarily."""
-        if hasattr(self._door, 'open_momentarily'):
-            await self._door.open_momentarily()
+        await self._async_send("open_momentarily")
 
     async def async_isolate(self, **kwargs: Any) -> None:
         """Isolate the door."""
-        if hasattr(self._door, 'isolate'):
-            await self._door.isolate()
+        await self._async_send("isolate")
 
     async def async_deisolate(self, **kwargs: Any) -> None:
         """Deisolate the door."""
-        if hasattr(self._door, 'deisolate'):
-            await self._door.deisolate()
+        await self._async_send("deisolate")
 
     async def async_inhibit(self, **kwargs: Any) -> None:
         """Inhibit the door."""
-        if hasattr(self._door, 'inhibit'):
-            await self._door.inhibit()
+        await self._async_send("inhibit")
 
     async def async_deinhibit(self, **kwargs: Any) -> None:
         """Deinhibit the door."""
-        if hasattr(self._door, 'deinhibit'):
-            await self._door.deinhibit()
+        await self._async_send("deinhibit")
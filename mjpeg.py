@@ -0,0 +1,101 @@
+"""MJPEG streaming synthesized from verification snapshots."""
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+
+from .snapshot import SnapshotCache
+
+_LOGGER = logging.getLogger(__name__)
+
+MJPEG_BOUNDARY = "spcframe"
+MAX_QUEUED_FRAMES = 2
+
+
+def mjpeg_part(image: bytes) -> bytes:
+    """Wrap an image as one part of a multipart MJPEG response."""
+    return (
+        f"--{MJPEG_BOUNDARY}\r\n"
+        "Content-Type: image/jpeg\r\n"
+        f"Content-Length: {len(image)}\r\n\r\n"
+    ).encode() + image + b"\r\n"
+
+
+class MjpegFanout:
+    """Poll one camera's snapshots and fan each new frame out to all clients.
+
+    A single fetch loop runs while at least one client is connected. Each
+    client has a small bounded queue; when a slow client falls behind its
+    oldest frame is dropped, so it always gets the latest frame and never
+    holds up the loop or the other clients.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, snapshots: SnapshotCache, fps: float
+    ) -> None:
+        """Initialize the fan-out."""
+        self.hass = hass
+        self._snapshots = snapshots
+        self.fps = fps
+        self._clients: set[asyncio.Queue[bytes]] = set()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def client_count(self) -> int:
+        """Return the number of connected clients."""
+        return len(self._clients)
+
+    @callback
+    def async_subscribe(self) -> asyncio.Queue[bytes]:
+        """Register a client and start polling if it is the first one."""
+        queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=MAX_QUEUED_FRAMES)
+        if (image := self._snapshots.image) is not None:
+            queue.put_nowait(image)
+        self._clients.add(queue)
+        if self._task is None:
+            self._task = self.hass.async_create_background_task(
+                self._async_run(), "acre_intrusion mjpeg fan-out"
+            )
+        return queue
+
+    @callback
+    def async_unsubscribe(self, queue: asyncio.Queue[bytes]) -> None:
+        """Remove a client and stop polling once nobody is watching."""
+        self._clients.discard(queue)
+        if not self._clients and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    @callback
+    def _async_publish(self, image: bytes) -> None:
+        """Hand a frame to every client, dropping stale frames for slow ones."""
+        for queue in self._clients:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(image)
+
+    async def _async_run(self) -> None:
+        """Fetch frames at the configured rate while clients are connected."""
+        loop = self.hass.loop
+        version = None
+        try:
+            while self._clients:
+                started = loop.time()
+                frame = await self._snapshots.async_refresh_frame()
+                if frame is not None and frame[0] != version:
+                    version = frame[0]
+                    self._async_publish(frame[1])
+                await asyncio.sleep(max(1 / self.fps - (loop.time() - started), 0))
+        finally:
+            if self._task is asyncio.current_task():
+                self._task = None
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop polling."""
+        self._clients.clear()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
@@ -0,0 +1,194 @@
+"""Output state tracking for acre Intrusion."""
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+import logging
+from typing import Any
+
+import aiohttp
+from aiohttp import hdrs
+
+from pyspcwebgw import SpcWebGateway
+from pyspcwebgw.area import Area
+from pyspcwebgw.const import ZoneStatus
+from pyspcwebgw.zone import Zone
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .runtime import jittered
+
+_LOGGER = logging.getLogger(__name__)
+
+OUTPUT_INTERVAL = timedelta(seconds=30)
+PROBE_INTERVAL = timedelta(seconds=5)
+REFRESH_COOLDOWN = 1.0  # seconds
+OUTPUT_CONCURRENCY = 4
+
+
+def _in_alarm(zone: Zone) -> bool:
+    """Return true if a zone is in alarm."""
+    return zone.status == ZoneStatus.ALARM
+
+
+class OutputCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
+    """Poll the panel outputs and keep their states indexed by id.
+
+    Refresh requests are debounced, so toggling a set of outputs in quick
+    succession ends in a single fetch of the output list.
+
+    The gateway does not push output changes. Outputs commonly follow
+    setting and alarms, so an area changing mode or a zone going into or out
+    of alarm triggers a debounced refresh; other pushes are ignored. When the
+    gateway tags the list with an ETag, polls also become conditional
+    requests that return no body while nothing changed, and run at the
+    shorter probe interval.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, api: SpcWebGateway, session: aiohttp.ClientSession
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name="spc_output",
+            update_interval=jittered(OUTPUT_INTERVAL),
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REFRESH_COOLDOWN, immediate=False
+            ),
+        )
+        self._api = api
+        self._session = session
+        self._indexed: list[dict[str, Any]] | None = None
+        self._states: dict[str, bool] = {}
+        self._etag: str | None = None
+        self._pushed: dict[tuple[str, str], Any] = {
+            **{("area", area.id): area.mode for area in api.areas.values()},
+            **{("zone", zone.id): _in_alarm(zone) for zone in api.zones.values()},
+        }
+        self._push_refresh = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=REFRESH_COOLDOWN,
+            immediate=True,
+            function=self.async_refresh,
+        )
+
+    @property
+    def states(self) -> dict[str, bool]:
+        """Return the on/off state of every output, keyed by output id."""
+        if self._indexed is not self.data:
+            self._indexed = self.data
+            self._states = {
+                output["id"]: output.get("state") == "1" for output in self.data or []
+            }
+        return self._states
+
+    async def _async_update_data(self) -> list[dict[str, Any]]:
+        """Fetch the output list, or keep it if the gateway reports no change."""
+        headers = {}
+        if self._etag is not None and self.data is not None:
+            headers[hdrs.IF_NONE_MATCH] = self._etag
+        try:
+            async with self._session.get(
+                f"{self._api._api_url}/spc/output", headers=headers
+            ) as resp:
+                if resp.status == 304:
+                    return self.data
+                if resp.status != 200:
+                    raise UpdateFailed(f"Gateway returned HTTP {resp.status}")
+                payload = await resp.json()
+                etag = resp.headers.get(hdrs.ETAG)
+        except aiohttp.ClientError as err:
+            raise UpdateFailed(f"Error fetching data: {err}") from err
+        if payload.get("status") != "success":
+            raise UpdateFailed("Gateway did not return the outputs")
+        if (etag is None) != (self._etag is None):
+            _LOGGER.debug(
+                "Gateway %s conditional output requests",
+                "supports" if etag else "does not support",
+            )
+            self.update_interval = jittered(PROBE_INTERVAL if etag else OUTPUT_INTERVAL)
+        self._etag = etag
+        return payload.get("data", {}).get("output", [])
+
+    @callback
+    def async_pushed(self, spc_object: Area | Zone) -> None:
+        """Refresh soon if a pushed area or zone change can affect outputs."""
+        if isinstance(spc_object, Area):
+            key, value = ("area", spc_object.id), spc_object.mode
+        else:
+            key, value = ("zone", spc_object.id), _in_alarm(spc_object)
+        if key in self._pushed and self._pushed[key] == value:
+            return
+        self._pushed[key] = value
+        self._push_refresh.async_schedule_call()
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending refreshes."""
+        await super().async_shutdown()
+        self._push_refresh.async_shutdown()
+
+    async def async_set_output(self, output_id: str, on: bool) -> bool:
+        """Switch an output and record the new state until the next refresh."""
+        if not await self._async_send(output_id, on):
+            return False
+        self.async_set_output_state(output_id, on)
+        return True
+
+    async def async_set_outputs(
+        self, output_ids: list[str], on: bool
+    ) -> dict[str, bool]:
+        """Switch several outputs and confirm them with a single refresh.
+
+        Returns whether the gateway accepted the command, per output.
+        """
+        semaphore = asyncio.Semaphore(OUTPUT_CONCURRENCY)
+
+        async def send(output_id: str) -> tuple[str, bool]:
+            async with semaphore:
+                return output_id, await self._async_send(output_id, on)
+
+        results = dict(
+            await asyncio.gather(*(send(output_id) for output_id in output_ids))
+        )
+        accepted = [output_id for output_id, sent in results.items() if sent]
+        if accepted:
+            for output_id in accepted:
+                self.states[output_id] = on
+            self._etag = None
+            self.async_update_listeners()
+            await self.async_refresh()
+        return results
+
+    async def _async_send(self, output_id: str, on: bool) -> bool:
+        """Send a set or reset command for an output."""
+        action = "set" if on else "reset"
+        try:
+            async with self._session.put(
+                f"{self._api._api_url}/spc/output/{output_id}/{action}"
+            ) as resp:
+                if resp.status != 200:
+                    _LOGGER.error(
+                        "Failed to %s output %s: HTTP %s",
+                        action,
+                        output_id,
+                        resp.status,
+                    )
+                    return False
+        except aiohttp.ClientError as err:
+            _LOGGER.error("Failed to %s output %s: %s", action, output_id, err)
+            return False
+        return True
+
+    @callback
+    def async_set_output_state(self, output_id: str, on: bool) -> None:
+        """Show an output's new state before the panel confirms it."""
+        if self.states.get(output_id) is not on:
+            self._states[output_id] = on
+            # The next fetch must not be answered from the unchanged list
+            self._etag = None
+            self.async_update_listeners()
@@ -0,0 +1,133 @@
+"""Dedicated HTTP connection pool for the SPC Web Gateway."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import time
+from types import SimpleNamespace
+
+import aiohttp
+from aiohttp import hdrs
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.util.ssl import client_context
+
+# The gateway is a single embedded web server: a few kept-alive connections
+# serve it best, plus one held open by the websocket.
+POOL_LIMIT = 8
+KEEPALIVE_TIMEOUT = 60  # seconds
+DNS_CACHE_TTL = 300  # seconds
+CONNECT_TIMEOUT = 5  # seconds
+READ_TIMEOUT = 20  # seconds
+
+
+@dataclass
+class PoolMetrics:
+    """Request and connection counters of a gateway pool."""
+
+    requests: int = 0
+    errors: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+    latency_total: float = 0.0
+
+    @property
+    def average_latency(self) -> float | None:
+        """Return the average request latency in milliseconds."""
+        if not self.requests:
+            return None
+        return round(self.latency_total / self.requests * 1000, 1)
+
+    def as_dict(self) -> dict[str, int | float | None]:
+        """Return the metrics as state attributes."""
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "average_latency_ms": self.average_latency,
+        }
+
+
+class GatewayPool:
+    """Own a tuned aiohttp session for one gateway.
+
+    Gateway traffic does not share a connector with the rest of Home
+    Assistant. Connections are capped and kept alive for reuse, DNS results
+    are cached, and every request is counted in the pool's metrics. Home
+    Assistant's SSL context and user agent are used as for its own sessions,
+    and the session is closed when Home Assistant stops.
+    """
+
+    def __init__(self, hass: HomeAssistant, limit: int = POOL_LIMIT + 1) -> None:
+        """Initialize the pool."""
+        self.hass = hass
+        self.metrics = PoolMetrics()
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self._on_request_start)
+        trace_config.on_request_end.append(self._on_request_end)
+        trace_config.on_request_exception.append(self._on_request_exception)
+        trace_config.on_connection_create_end.append(self._on_connection_create)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuse)
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=limit,
+                limit_per_host=limit,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=DNS_CACHE_TTL,
+                ssl=client_context(),
+            ),
+            headers={hdrs.USER_AGENT: SERVER_SOFTWARE},
+            timeout=aiohttp.ClientTimeout(
+                connect=CONNECT_TIMEOUT, sock_read=READ_TIMEOUT
+            ),
+            trace_configs=[trace_config],
+        )
+        self._unsub_close = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, self._async_close_on_stop
+        )
+
+    async def async_close(self) -> None:
+        """Close the session and all pooled connections."""
+        if self._unsub_close is not None:
+            self._unsub_close()
+            self._unsub_close = None
+        await self.session.close()
+
+    @callback
+    def _async_close_on_stop(self, event: Event) -> None:
+        """Close the session when Home Assistant stops."""
+        self._unsub_close = None
+        self.hass.async_create_task(self.session.close())
+
+    async def _on_request_start(
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params
+    ) -> None:
+        """Remember when a request started."""
+        context.started = time.monotonic()
+
+    async def _on_request_end(
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params
+    ) -> None:
+        """Count a completed request and its latency."""
+        self.metrics.requests += 1
+        self.metrics.latency_total += time.monotonic() - context.started
+
+    async def _on_request_exception(
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params
+    ) -> None:
+        """Count a failed request."""
+        self.metrics.errors += 1
+
+    async def _on_connection_create(
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params
+    ) -> None:
+        """Count a newly opened connection."""
+        self.metrics.connections_created += 1
+
+    async def _on_connection_reuse(
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params
+    ) -> None:
+        """Count a reused keep-alive connection."""
+        self.metrics.connections_reused += 1
@@ -0,0 +1,101 @@
+"""Per-entry runtime data for acre Intrusion."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import timedelta
+import logging
+import random
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import DeviceInfo
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from pyspcwebgw import SpcWebGateway
+
+    from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+    from .activity import AreaActivityTracker
+    from .alerts import AlertDecoder
+    from .commands import CommandQueue
+    from .connection import ConnectionSupervisor
+    from .devices import DevicePoller
+    from .lock import SpcDoorLock
+    from .pool import GatewayPool
+    from .storage import PinStorage
+    from .warm_start import WarmStart
+    from .zone_index import ZoneStateIndex
+
+_LOGGER = logging.getLogger(__name__)
+
+POLL_JITTER = 0.1  # fraction of the poll interval
+
+
+def jittered(interval: timedelta, spread: float = POLL_JITTER) -> timedelta:
+    """Return the interval stretched or shrunk by a random fraction.
+
+    Every panel gets its own interval, so the schedules of several panels
+    drift apart instead of polling all gateways at the same moment.
+    """
+    return interval * random.uniform(1 - spread, 1 + spread)
+
+
+@dataclass(frozen=True)
+class SpcPanel:
+    """Identity of one configured panel."""
+
+    entry_id: str
+    serial: str
+    host: str
+
+    def unique_id(self, suffix: str) -> str:
+        """Return a unique id scoped to the panel serial."""
+        return f"{DOMAIN}_{self.serial}_{suffix}"
+
+    def device_info(self, model: str) -> DeviceInfo:
+        """Return the device of the panel."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.serial)},
+            name=f"SPC Panel ({self.host})",
+            manufacturer="Vanderbilt",
+            model=model,
+        )
+
+
+@dataclass
+class SpcRuntimeData:
+    """Gateway, helpers and caches of one config entry."""
+
+    entry_id: str
+    api: SpcWebGateway
+    panel: SpcPanel | None = None
+    pool: GatewayPool | None = None
+    warm_start: WarmStart | None = None
+    decoder: AlertDecoder | None = None
+    zone_index: ZoneStateIndex | None = None
+    tracker: AreaActivityTracker | None = None
+    commands: CommandQueue | None = None
+    poller: DevicePoller | None = None
+    pins: PinStorage | None = None
+    supervisor: ConnectionSupervisor | None = None
+    platforms: list[Platform] = field(default_factory=list)
+    locks: dict[str, SpcDoorLock] = field(default_factory=dict)
+    coordinators: dict[str, DataUpdateCoordinator] = field(default_factory=dict)
+    started: float = field(default_factory=time.monotonic)
+    timings: dict[str, float] = field(default_factory=dict)
+
+    def record_timing(self, stage: str) -> None:
+        """Record how many seconds after setup started a stage completed."""
+        self.timings[stage] = round(time.monotonic() - self.started, 3)
+        _LOGGER.debug(
+            "Panel %s reached %s after %.3fs", self.entry_id, stage, self.timings[stage]
+        )
+
+
+def get_runtime(hass: HomeAssistant, entry_id: str) -> SpcRuntimeData | None:
+    """Return the runtime data of a config entry."""
+    return hass.data.get(DOMAIN, {}).get(entry_id)
@@ -2,9 +2,9 @@
 from __future__ import annotations
 
 import logging
-from pyspcwebgw import SpcWebGateway
-import aiohttp
-from datetime import timedelta
+from functools import partial
+from typing import TYPE_CHECKING, Any
+from datetime import datetime, timedelta
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
@@ -16,496 +16,34 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.const import (
-    PERCENTAGE,
-    SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
-    UnitOfElectricCurrent,
-    UnitOfElectricPotential,
-    UnitOfFrequency,
-    EntityCategory,
-    Platform,
+from homeassistant.const import EntityCategory, Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
 )
-from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import EntityCategory  # Add this import
-from homeassistant.helpers import aiohttp_client
 
-from . import DATA_API
-from .const import CONF_API_URL, DATA_API
+from .activity import ACTIVITY_WINDOW, AreaActivityTracker
+from .const import (
+    SIGNAL_CONNECTION_UPDATED,
+    SIGNAL_PANEL_CONFIG_CHANGED,
+    SIGNAL_TOPOLOGY_UPDATED,
+    SIGNAL_UPDATE_AREA_ACTIVITY,
+    SOURCE_SENSOR,
+)
+from .topology import EntitySync
+from .runtime import SpcPanel, SpcRuntimeData, get_runtime, jittered
+from .warm_start import WarmStartEntity
 
-_LOGGER = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from pyspcwebgw import SpcWebGateway
 
-SENSOR_TYPES = [
-    SensorEntityDescription(
-        key="batt_volt",
-        name="Battery Voltage",
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_category=EntityCategory.DIAGNOSTIC,  # Changed from string to enum
-    ),
-    SensorEntityDescription(
-        key="aux_volt",
-        name="Auxiliary Voltage",
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="aux_curr",
-        name="Auxiliary Current",
-        native_unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="ac_freq",
-        name="AC Frequency",
-        native_unit_of_measurement=UnitOfFrequency.HERTZ,
-        device_class=SensorDeviceClass.FREQUENCY,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="gsm_signal",
-        name="GSM Signal",
-        native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
-        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="psu_batt_volt",
-        name="PSU Battery Voltage",
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="psu_batt_curr",
-        name="PSU Battery Current",
-        native_unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="psu_out1_volt",
-        name="PSU Output 1 Voltage",
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="psu_out1_curr",
-        name="PSU Output 1 Current",
-        native_unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="psu_out2_volt",
-        name="PSU Output 2 Voltage",
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="psu_out2_curr",
-        name="PSU Output 2 Current",
-        native_unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="psu_out3_volt",
-        name="PSU Output 3 Voltage",
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="psu_out3_curr",
-        name="PSU Output 3 Current",
-        native_unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-]
-
-PANEL_SENSOR_TYPES = [
-    SensorEntityDescription(
-        key="panel_type",
-        name="Panel Type",
-        device_class=None,
-        state_class=None,
-    ),
-    SensorEntityDescription(
-        key="panel_variant",
-        name="Panel Variant",
-        device_class=None,
-        state_class=None,
-    ),
-    SensorEntityDescription(
-        key="panel_version",
-        name="Panel Version",
-        device_class=None,
-        state_class=None,
-    ),
-    SensorEntityDescription(
-        key="panel_device_id",
-        name="Panel Device ID",
-        device_class=None,
-        state_class=None,
-    ),
-    SensorEntityDescription(
-        key="panel_sn",
-        name="Panel Serial Number",
-        device_class=None,
-        state_class=None,
-    ),
-    SensorEntityDescription(
-        key="panel_cfgtime",
-        name="Panel Configuration Time",
-        device_class=None,
-        state_class=None,
-    ),
-    SensorEntityDescription(
-        key="panel_hw_ver_major",
-        name="Panel Hardware Version Major",
-        device_class=None,
-        state_class=None,
-    ),
-    SensorEntityDescription(
-        key="panel_hw_ver_minor",
-        name="Panel Hardware Version Minor",
-        device_class=None,
-        state_class=None,
-    ),
-    SensorEntityDescription(
-        key="panel_hw_ver_vds",
-        name="Panel Hardware Version VDS",
-        device_class=None,
-        state_class=None,
-    ),
-    SensorEntityDescription(
-        key="panel_license_key",
-        name="Panel License Key",
-        device_class=None,
-        state_class=None,
-    ),
-]
-
-XBUS_SENSORS = [
-    SensorEntityDescription(
-        key="xbus_status",
-        name="X-BUS Status",
-        icon="mdi:network",
-    ),
-    SensorEntityDescription(
-        key="xbus_voltage",
-        name="X-BUS Voltage",
-        device_class=SensorDeviceClass.VOLTAGE,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-]
-
-SYSTEM_SENSOR_TYPES = [
-    SensorEntityDescription(
-        key="system_time",
-        name="System Time",
-        device_class=None,
-        state_class=None,
-    ),
-    SensorEntityDescription(
-        key="system_engmode",
-        name="Engineering Mode",
-        device_class=None,
-        state_class=None,
-    ),
-    SensorEntityDescription(
-        key="system_rf_type",
-        name="RF Type",
-        device_class=None,
-        state_class=None,
-    ),
-    SensorEntityDescription(
-        key="system_rf_version",
-        name="RF Version",
-        device_class=None,
-        state_class=None,
-    ),
-]
-
-MODEM_SENSOR_TYPES = [
-    SensorEntityDescription(
-        key="port",
-        name="Port",
-        icon="mdi:port",
-    ),
-    SensorEntityDescription(
-        key="enabled",
-        name="Enabled",
-        icon="mdi:power",
-    ),
-    SensorEntityDescription(
-        key="status",
-        name="Status",
-        icon="mdi:information",
-    ),
-    SensorEntityDescription(
-        key="state",
-        name="State",
-        icon="mdi:state-machine",
-    ),
-    SensorEntityDescription(
-        key="type",
-        name="Type",
-        icon="mdi:cellphone-link",
-    ),
-    SensorEntityDescription(
-        key="id_type",
-        name="Model",
-        icon="mdi:radio-tower",
-    ),
-    SensorEntityDescription(
-        key="id_fw",
-        name="Firmware",
-        icon="mdi:firmware",
-    ),
-    SensorEntityDescription(
-        key="id_hw",
-        name="Hardware Version",
-        icon="mdi:circuit-board",
-    ),
-    SensorEntityDescription(
-        key="capabilities",
-        name="Capabilities",
-        icon="mdi:feature-search",
-    ),
-    SensorEntityDescription(
-        key="gsm_signal",
-        name="GSM Signal",
-        icon="mdi:signal",
-        native_unit_of_measurement="bars",
-    ),
-    SensorEntityDescription(
-        key="incoming_time",
-        name="Incoming Time",
-        icon="mdi:timer-outline",
-    ),
-    SensorEntityDescription(
-        key="incoming_count",
-        name="Incoming Count",
-        icon="mdi:counter",
-    ),
-    SensorEntityDescription(
-        key="outgoing_time",
-        name="Outgoing Time",
-        icon="mdi:timer",
-    ),
-    SensorEntityDescription(
-        key="outgoing_count",
-        name="Outgoing Count",
-        icon="mdi:counter",
-    ),
-    SensorEntityDescription(
-        key="outgoing_failed",
-        name="Failed Outgoing",
-        icon="mdi:alert-circle",
-    ),
-    SensorEntityDescription(
-        key="incoming_sms_count",
-        name="Incoming SMS",
-        icon="mdi:message-incoming",
-    ),
-    SensorEntityDescription(
-        key="outgoing_sms_count",
-        name="Outgoing SMS",
-        icon="mdi:message-outgoing",
-    ),
-]
-
-# Add this new constant after other sensor type definitions
-ETHERNET_SENSOR_TYPES = [
-    SensorEntityDescription(
-        key="fitted",
-        name="Ethernet Fitted",
-        icon="mdi:ethernet",
-    ),
-    SensorEntityDescription(
-        key="state",
-        name="Ethernet State",
-        icon="mdi:ethernet",
-    ),
-    SensorEntityDescription(
-        key="dhcp_enabled",
-        name="DHCP Enabled",
-        icon="mdi:ip-network",
-    ),
-    SensorEntityDescription(
-        key="mac_address",
-        name="MAC Address",
-        icon="mdi:ethernet",
-    ),
-    SensorEntityDescription(
-        key="ip_address",
-        name="IP Address",
-        icon="mdi:ip",
-    ),
-    SensorEntityDescription(
-        key="netmask",
-        name="Network Mask",
-        icon="mdi:ip-network",
-    ),
-    SensorEntityDescription(
-        key="gateway",
-        name="Gateway",
-        icon="mdi:router-network",
-    ),
-    SensorEntityDescription(
-        key="tx_packets",
-        name="Transmitted Packets",
-        icon="mdi:upload-network",
-        state_class=SensorStateClass.TOTAL_INCREASING,
-    ),
-    SensorEntityDescription(
-        key="tx_bytes",
-        name="Transmitted Bytes",
-        icon="mdi:upload-network",
-        state_class=SensorStateClass.TOTAL_INCREASING,
-        native_unit_of_measurement="bytes",
-    ),
-    SensorEntityDescription(
-        key="rx_packets",
-        name="Received Packets",
-        icon="mdi:download-network",
-        state_class=SensorStateClass.TOTAL_INCREASING,
-    ),
-    SensorEntityDescription(
-        key="rx_bytes",
-        name="Received Bytes",
-        icon="mdi:download-network",
-        state_class=SensorStateClass.TOTAL_INCREASING,
-        native_unit_of_measurement="bytes",
-    ),
-]
-
-# Add this new constant after other sensor type definitions
-AREA_SENSOR_TYPES = [
-    SensorEntityDescription(
-        key="mode",
-        name="Mode",
-        icon="mdi:security",
-    ),
-    SensorEntityDescription(
-        key="last_set_time",
-        name="Last Set Time",
-        icon="mdi:clock",
-    ),
-    SensorEntityDescription(
-        key="last_unset_time",
-        name="Last Unset Time",
-        icon="mdi:clock",
-    ),
-    SensorEntityDescription(
-        key="last_set_user_id",
-        name="Last Set User ID",
-        icon="mdi:account",
-    ),
-    SensorEntityDescription(
-        key="last_set_user_name",
-        name="Last Set User Name",
-        icon="mdi:account",
-    ),
-    SensorEntityDescription(
-        key="last_unset_user_id",
-        name="Last Unset User ID",
-        icon="mdi:account",
-    ),
-    SensorEntityDescription(
-        key="last_unset_user_name",
-        name="Last Unset User Name",
-        icon="mdi:account",
-    ),
-    SensorEntityDescription(
-        key="last_alarm",
-        name="Last Alarm",
-        icon="mdi:alarm",
-    ),
-]
-
-# Add this new constant after other sensor type definitions
-XBUS_NODE_SENSOR_TYPES = [
-    SensorEntityDescription(
-        key="aux_volt",
-        name="Auxiliary Voltage",
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="aux_curr",
-        name="Auxiliary Current",
-        native_unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="psu_out1_volt",
-        name="PSU Output 1 Voltage",
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="psu_out1_curr",
-        name="PSU Output 1 Current",
-        native_unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="psu_out2_volt",
-        name="PSU Output 2 Voltage",
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="psu_out2_curr",
-        name="PSU Output 2 Current",
-        native_unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="psu_out3_volt",
-        name="PSU Output 3 Voltage",
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="psu_out3_curr",
-        name="PSU Output 3 Current",
-        native_unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="psu_batt_volt",
-        name="PSU Battery Voltage",
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="psu_batt_curr",
-        name="PSU Battery Current",
-        native_unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-]
+    from .connection import ConnectionSupervisor
+    from .pool import GatewayPool
+
+_LOGGER = logging.getLogger(__name__)
 
 SCAN_INTERVAL = timedelta(minutes=1)
 
@@ -513,9 +51,23 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up Acre SPC sensor based on a config entry."""
-    api: SpcWebGateway = hass.data[DATA_API]
-    session = aiohttp_client.async_get_clientsession(hass)
-    api_ip = entry.data[CONF_API_URL].split("//")[-1].split("/")[0]  # Extract IP address from API URL
+    # The description tables are only built once the platform is set up
+    from .sensor_types import (
+        AREA_SENSOR_TYPES,
+        ETHERNET_SENSOR_TYPES,
+        MODEM_SENSOR_TYPES,
+        PANEL_SENSOR_TYPES,
+        SENSOR_TYPES,
+        SYSTEM_SENSOR_TYPES,
+        XBUS_NODE_SENSOR_TYPES,
+        XBUS_SENSORS,
+    )
+
+    runtime: SpcRuntimeData = get_runtime(hass, entry.entry_id)
+    api = runtime.api
+    pool = runtime.pool
+    session = pool.session
+    panel = runtime.panel
     
     # Create update coordinator
     coordinator = DataUpdateCoordinator(
@@ -523,83 +75,122 @@ async def async_setup_entry(
         _LOGGER,
         name="acre_intrusion_psu",
         update_method=lambda: async_update_data(api, session),
-        update_interval=SCAN_INTERVAL,
+        update_interval=jittered(SCAN_INTERVAL),
     )
-
-    # Initial data fetch
-    await coordinator.async_refresh()
+    runtime.coordinators[SOURCE_SENSOR] = coordinator
+
+    # Start from the stored telemetry, if any; the first refresh runs in
+    # the background once the platform is set up
+    warm_start = runtime.warm_start
+    if (stored := warm_start.get(SOURCE_SENSOR)) is not None:
+        coordinator.data = stored
+
+    @callback
+    def _async_store_data() -> None:
+        """Keep the stored telemetry up to date."""
+        if coordinator.last_update_success:
+            warm_start.async_update(SOURCE_SENSOR, coordinator.data)
+
+    entry.async_on_unload(coordinator.async_add_listener(_async_store_data))
+
+    cfgtime = (coordinator.data or {}).get("panel_cfgtime")
+
+    @callback
+    def _async_check_cfgtime() -> None:
+        """Signal a panel configuration change when panel_cfgtime moves."""
+        nonlocal cfgtime
+        new_cfgtime = (coordinator.data or {}).get("panel_cfgtime")
+        if new_cfgtime is None or new_cfgtime == cfgtime:
+            return
+        known, cfgtime = cfgtime, new_cfgtime
+        if known is None:
+            return
+        _LOGGER.debug("Panel configuration changed at %s", new_cfgtime)
+        async_dispatcher_send(hass, SIGNAL_PANEL_CONFIG_CHANGED.format(entry.entry_id))
+
+    entry.async_on_unload(coordinator.async_add_listener(_async_check_cfgtime))
     
     entities = []
     for description in SENSOR_TYPES:
-        entities.append(SpcSystemSensor(coordinator, api, description, api_ip))
+        entities.append(SpcSystemSensor(coordinator, api, description, panel))
     
     for description in PANEL_SENSOR_TYPES:
-        entities.append(SpcSystemSensor(coordinator, api, description, api_ip))
+        entities.append(SpcSystemSensor(coordinator, api, description, panel))
     
     for description in SYSTEM_SENSOR_TYPES:
-        entities.append(SpcSystemSensor(coordinator, api, description, api_ip))
-    
-    for modem_num in range(1, 3):  # Support for 2 modems
-        if any(key.startswith(f"modem_{modem_num}_") for key in coordinator.data or {}):
-            for description in MODEM_SENSOR_TYPES:
-                entities.append(
-                    ModemSensor(
-                        coordinator,
-                        api,
-                        description,
-                        modem_num,
-                        api_ip
-                    )
-                )
+        entities.append(SpcSystemSensor(coordinator, api, description, panel))
     
     if hasattr(api, 'xbus_nodes'):
         for node in api.xbus_nodes.values():
             for description in XBUS_SENSORS:
-                entities.append(XbusNodeSensor(node, description, api_ip))
-    
-    # Add ethernet sensors
-    if coordinator.data and any(key.startswith("ethernet_") for key in coordinator.data):
-        for description in ETHERNET_SENSOR_TYPES:
-            entities.append(
-                EthernetSensor(
-                    coordinator,
-                    api,
-                    description,
-                    api_ip
+                entities.append(XbusNodeSensor(node, description, panel))
+
+    entities.append(GatewayPoolSensor(coordinator, pool, panel, runtime.timings))
+    entities.append(GatewayConnectionSensor(runtime.supervisor, panel))
+
+    async_add_entities(entities)
+
+    tracker = runtime.tracker
+    sync = EntitySync(hass, async_add_entities)
+
+    async def async_sync_topology() -> None:
+        """Create the sensors of the modems, areas and nodes the panel reports."""
+        data = coordinator.data or {}
+        factories = {}
+
+        for modem_num in range(1, 3):  # Support for 2 modems
+            if any(key.startswith(f"modem_{modem_num}_") for key in data):
+                for description in MODEM_SENSOR_TYPES:
+                    factories[("modem", modem_num, description.key)] = partial(
+                        ModemSensor, coordinator, api, description, modem_num, panel
+                    )
+
+        # Add ethernet sensors
+        if any(key.startswith("ethernet_") for key in data):
+            for description in ETHERNET_SENSOR_TYPES:
+                factories[("ethernet", description.key)] = partial(
+                    EthernetSensor, coordinator, api, description, panel
                 )
-            )
 
-    # Add area sensors
-    if coordinator.data and any(key.startswith("area_") for key in coordinator.data):
+        # Add area sensors
         for area_id in range(1, 6):  # Assuming up to 5 areas
-            if any(key.startswith(f"area_{area_id}_") for key in coordinator.data):
+            if any(key.startswith(f"area_{area_id}_") for key in data):
                 for description in AREA_SENSOR_TYPES:
-                    entities.append(
-                        AreaSensor(
-                            coordinator,
-                            api,
-                            description,
-                            area_id,
-                            api_ip
-                        )
+                    factories[("area", area_id, description.key)] = partial(
+                        AreaSensor, coordinator, api, description, area_id, panel
                     )
 
-    # Add xbus node sensors
-    if coordinator.data and any(key.startswith("xbusnode_") for key in coordinator.data):
+        # Add xbus node sensors
         for node_id in range(1, 9):  # Assuming up to 8 nodes
-            if any(key.startswith(f"xbusnode_{node_id}_") for key in coordinator.data):
+            if any(key.startswith(f"xbusnode_{node_id}_") for key in data):
                 for description in XBUS_NODE_SENSOR_TYPES:
-                    entities.append(
-                        XbusNodeSensor(
-                            coordinator,
-                            api,
-                            description,
-                            node_id,
-                            api_ip
-                        )
+                    factories[("xbusnode", node_id, description.key)] = partial(
+                        XbusNodeSensor, coordinator, api, description, node_id, panel
                     )
 
-    async_add_entities(entities)
+        # Add area activity sensors
+        for area_id, area_name in tracker.areas.items():
+            factories[("activity", area_id)] = partial(
+                AreaActivitySensor, tracker, area_id, area_name, panel
+            )
+
+        await sync.async_sync(factories)
+
+    async def async_prime() -> None:
+        """Fetch the first telemetry and add the sensors it reveals."""
+        await coordinator.async_refresh()
+        runtime.record_timing("sensor_primed")
+        await async_sync_topology()
+
+    await async_sync_topology()
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_TOPOLOGY_UPDATED.format(entry.entry_id), async_sync_topology
+        )
+    )
+    entry.async_create_background_task(
+        hass, async_prime(), "acre_intrusion sensor refresh"
+    )
 
 async def async_update_data(api, session):
     """Fetch data from API."""
@@ -706,24 +297,22 @@ async def async_update_data(api, session):
         _LOGGER.error("Error fetching data: %s", err)
         return None
 
-class SpcSystemSensor(CoordinatorEntity, SensorEntity):
+class SpcSystemSensor(WarmStartEntity, CoordinatorEntity, SensorEntity):
     """Representation of a SPC sensor."""
 
+    _warm_start_source = SOURCE_SENSOR
+
     def __init__(
-        self, coordinator, api: SpcWebGateway, description: SensorEntityDescription, api_ip: str
+        self, coordinator, api: SpcWebGateway, description: SensorEntityDescription, panel: SpcPanel
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entity_description = description
         self._api = api
         self._attr_name = description.name
-        self._attr_unique_id = f"acre_intrusion_system_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {("acre_intrusion", api_ip)},
-            "name": f"SPC Panel ({api_ip})",
-            "manufacturer": "Vanderbilt",
-            "model": "SPC Panel",
-        }
+        self._panel = panel
+        self._attr_unique_id = panel.unique_id(f"system_{description.key}")
+        self._attr_device_info = panel.device_info("SPC Panel")
 
     @property
     def native_value(self) -> float | str | None:
@@ -751,18 +340,14 @@ class SpcSystemSensor(CoordinatorEntity, SensorEntity):
 class XbusNodeSensor(SensorEntity):
     """Representation of an X-BUS node sensor."""
 
-    def __init__(self, node, description: SensorEntityDescription, api_ip: str) -> None:
+    def __init__(self, node, description: SensorEntityDescription, panel: SpcPanel) -> None:
         """Initialize the sensor."""
         self.entity_description = description
         self._node = node
-        self._attr_unique_id = f"acre_intrusion_xbus_{node.id}_{description.key}"
+        self._panel = panel
+        self._attr_unique_id = panel.unique_id(f"xbus_{node.id}_{description.key}")
         self._attr_name = f"{node.name} {description.name}"
-        self._attr_device_info = {
-            "identifiers": {("acre_intrusion", api_ip)},
-            "name": f"SPC Panel ({api_ip})",
-            "manufacturer": "Vanderbilt",
-            "model": "SPC X-BUS Node",
-        }
+        self._attr_device_info = panel.device_info("SPC X-BUS Node")
 
     @property
     def native_value(self) -> float | None:
@@ -778,11 +363,13 @@ class XbusNodeSensor(SensorEntity):
         elif self.entity_description.key == "xbus_status":
             return "Online" if self._node.status == 0 else "Problem"
 
-class ModemSensor(CoordinatorEntity, SensorEntity):
+class ModemSensor(WarmStartEntity, CoordinatorEntity, SensorEntity):
     """Representation of a modem sensor."""
 
+    _warm_start_source = SOURCE_SENSOR
+
     def __init__(
-        self, coordinator, api: SpcWebGateway, description: SensorEntityDescription, modem_num: int, api_ip: str
+        self, coordinator, api: SpcWebGateway, description: SensorEntityDescription, modem_num: int, panel: SpcPanel
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
@@ -790,13 +377,9 @@ class ModemSensor(CoordinatorEntity, SensorEntity):
         self._api = api
         self._modem_num = modem_num
         self._attr_name = f"Modem {modem_num} {description.name}"
-        self._attr_unique_id = f"acre_intrusion_modem_{modem_num}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {("acre_intrusion", api_ip)},
-            "name": f"SPC Panel ({api_ip})",
-            "manufacturer": "Vanderbilt",
-            "model": "SPC Modem",
-        }
+        self._panel = panel
+        self._attr_unique_id = panel.unique_id(f"modem_{modem_num}_{description.key}")
+        self._attr_device_info = panel.device_info("SPC Modem")
 
     @property
     def native_value(self):
@@ -815,24 +398,22 @@ class ModemSensor(CoordinatorEntity, SensorEntity):
         return value
 
 # Add new EthernetSensor class
-class EthernetSensor(CoordinatorEntity, SensorEntity):
+class EthernetSensor(WarmStartEntity, CoordinatorEntity, SensorEntity):
     """Representation of an Ethernet sensor."""
 
+    _warm_start_source = SOURCE_SENSOR
+
     def __init__(
-        self, coordinator, api: SpcWebGateway, description: SensorEntityDescription, api_ip: str
+        self, coordinator, api: SpcWebGateway, description: SensorEntityDescription, panel: SpcPanel
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entity_description = description
         self._api = api
         self._attr_name = f"Ethernet {description.name}"
-        self._attr_unique_id = f"acre_intrusion_ethernet_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {("acre_intrusion", api_ip)},
-            "name": f"SPC Panel ({api_ip})",
-            "manufacturer": "Vanderbilt",
-            "model": "SPC Ethernet Interface",
-        }
+        self._panel = panel
+        self._attr_unique_id = panel.unique_id(f"ethernet_{description.key}")
+        self._attr_device_info = panel.device_info("SPC Ethernet Interface")
 
     @property
     def native_value(self):
@@ -854,11 +435,13 @@ class EthernetSensor(CoordinatorEntity, SensorEntity):
         return value
 
 # Add new AreaSensor class
-class AreaSensor(CoordinatorEntity, SensorEntity):
+class AreaSensor(WarmStartEntity, CoordinatorEntity, SensorEntity):
     """Representation of an Area sensor."""
 
+    _warm_start_source = SOURCE_SENSOR
+
     def __init__(
-        self, coordinator, api: SpcWebGateway, description: SensorEntityDescription, area_id: int, api_ip: str
+        self, coordinator, api: SpcWebGateway, description: SensorEntityDescription, area_id: int, panel: SpcPanel
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
@@ -866,13 +449,9 @@ class AreaSensor(CoordinatorEntity, SensorEntity):
         self._api = api
         self._area_id = area_id
         self._attr_name = f"Area {area_id} {description.name}"
-        self._attr_unique_id = f"acre_intrusion_area_{area_id}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {("acre_intrusion", api_ip)},
-            "name": f"SPC Panel ({api_ip})",
-            "manufacturer": "Vanderbilt",
-            "model": "SPC Area",
-        }
+        self._panel = panel
+        self._attr_unique_id = panel.unique_id(f"area_{area_id}_{description.key}")
+        self._attr_device_info = panel.device_info("SPC Area")
 
     @property
     def native_value(self):
@@ -892,11 +471,13 @@ class AreaSensor(CoordinatorEntity, SensorEntity):
         return value
 
 # Add new XbusNodeSensor class
-class XbusNodeSensor(CoordinatorEntity, SensorEntity):
+class XbusNodeSensor(WarmStartEntity, CoordinatorEntity, SensorEntity):
     """Representation of an X-BUS node sensor."""
 
+    _warm_start_source = SOURCE_SENSOR
+
     def __init__(
-        self, coordinator, api: SpcWebGateway, description: SensorEntityDescription, node_id: int, api_ip: str
+        self, coordinator, api: SpcWebGateway, description: SensorEntityDescription, node_id: int, panel: SpcPanel
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
@@ -904,13 +485,9 @@ class XbusNodeSensor(CoordinatorEntity, SensorEntity):
         self._api = api
         self._node_id = node_id
         self._attr_name = f"X-BUS Node {node_id} {description.name}"
-        self._attr_unique_id = f"acre_intrusion_xbusnode_{node_id}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {("acre_intrusion", api_ip)},
-            "name": f"SPC Panel ({api_ip})",
-            "manufacturer": "Vanderbilt",
-            "model": "SPC X-BUS Node",
-        }
+        self._panel = panel
+        self._attr_unique_id = panel.unique_id(f"xbusnode_{node_id}_{description.key}")
+        self._attr_device_info = panel.device_info("SPC X-BUS Node")
 
     @property
     def native_value(self):
@@ -939,3 +516,130 @@ class XbusNodeSensor(CoordinatorEntity, SensorEntity):
                 return None
             
         return value
+
+class AreaActivitySensor(SensorEntity):
+    """Number of zones triggered in an area within the activity window."""
+
+    _attr_should_poll = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:motion-sensor"
+
+    def __init__(
+        self, tracker: AreaActivityTracker, area_id: str, area_name: str, panel: SpcPanel
+    ) -> None:
+        """Initialize the sensor."""
+        self._tracker = tracker
+        self._area_id = area_id
+        self._attr_name = f"{area_name} Activity"
+        self._panel = panel
+        self._attr_unique_id = panel.unique_id(f"area_{area_id}_activity")
+        self._attr_device_info = panel.device_info("SPC Area")
+
+    async def async_added_to_hass(self) -> None:
+        """Call for adding new entities."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_UPDATE_AREA_ACTIVITY.format(self._panel.entry_id, self._area_id),
+                self._update_callback,
+            )
+        )
+
+    @callback
+    def _update_callback(self) -> None:
+        """Write the aggregated activity state."""
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of distinct zones triggered in the window."""
+        return self._tracker.triggered_zones(self._area_id)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, int]:
+        """Return the raw trigger count and window length."""
+        return {
+            "triggers": self._tracker.trigger_count(self._area_id),
+            "window_seconds": ACTIVITY_WINDOW,
+        }
+
+class GatewayPoolSensor(CoordinatorEntity, SensorEntity):
+    """Request metrics of the gateway connection pool."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_icon = "mdi:lan-connect"
+
+    def __init__(
+        self,
+        coordinator,
+        pool: GatewayPool,
+        panel: SpcPanel,
+        timings: dict[str, float] | None = None,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._pool = pool
+        self._timings = timings
+        self._attr_name = "Gateway Requests"
+        self._panel = panel
+        self._attr_unique_id = panel.unique_id("gateway_requests")
+        self._attr_device_info = panel.device_info("SPC Panel")
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of requests sent to the gateway."""
+        return self._pool.metrics.requests
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the connection pool metrics and startup timings."""
+        attributes: dict[str, Any] = self._pool.metrics.as_dict()
+        if self._timings:
+            attributes["startup_timings"] = dict(self._timings)
+        return attributes
+
+
+class GatewayConnectionSensor(SensorEntity):
+    """Since when the gateway websocket has been connected."""
+
+    _attr_should_poll = False
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:connection"
+
+    def __init__(self, supervisor: ConnectionSupervisor, panel: SpcPanel) -> None:
+        """Initialize the sensor."""
+        self._supervisor = supervisor
+        self._attr_name = "Gateway Connected Since"
+        self._panel = panel
+        self._attr_unique_id = panel.unique_id("gateway_connected_since")
+        self._attr_device_info = panel.device_info("SPC Panel")
+
+    async def async_added_to_hass(self) -> None:
+        """Call for adding new entities."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_CONNECTION_UPDATED.format(self._panel.entry_id),
+                self._update_callback,
+            )
+        )
+
+    @callback
+    def _update_callback(self) -> None:
+        """Write the connection state."""
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> datetime | None:
+        """Return when the current connection came up."""
+        return self._supervisor.connected_since
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the reconnect count and duration of the last resync."""
+        return {
+            "reconnects": self._supervisor.reconnects,
+            "last_resync_seconds": self._supervisor.last_resync_duration,
+        }
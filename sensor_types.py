@@ -0,0 +1,487 @@
+"""Sensor descriptions for acre Intrusion system information."""
+from __future__ import annotations
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import (
+    SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+    EntityCategory,
+    UnitOfElectricCurrent,
+    UnitOfElectricPotential,
+    UnitOfFrequency,
+)
+
+SENSOR_TYPES = [
+    SensorEntityDescription(
+        key="batt_volt",
+        name="Battery Voltage",
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,  # Changed from string to enum
+    ),
+    SensorEntityDescription(
+        key="aux_volt",
+        name="Auxiliary Voltage",
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="aux_curr",
+        name="Auxiliary Current",
+        native_unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="ac_freq",
+        name="AC Frequency",
+        native_unit_of_measurement=UnitOfFrequency.HERTZ,
+        device_class=SensorDeviceClass.FREQUENCY,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="gsm_signal",
+        name="GSM Signal",
+        native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="psu_batt_volt",
+        name="PSU Battery Voltage",
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="psu_batt_curr",
+        name="PSU Battery Current",
+        native_unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="psu_out1_volt",
+        name="PSU Output 1 Voltage",
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="psu_out1_curr",
+        name="PSU Output 1 Current",
+        native_unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="psu_out2_volt",
+        name="PSU Output 2 Voltage",
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="psu_out2_curr",
+        name="PSU Output 2 Current",
+        native_unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="psu_out3_volt",
+        name="PSU Output 3 Voltage",
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="psu_out3_curr",
+        name="PSU Output 3 Current",
+        native_unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+]
+
+PANEL_SENSOR_TYPES = [
+    SensorEntityDescription(
+        key="panel_type",
+        name="Panel Type",
+        device_class=None,
+        state_class=None,
+    ),
+    SensorEntityDescription(
+        key="panel_variant",
+        name="Panel Variant",
+        device_class=None,
+        state_class=None,
+    ),
+    SensorEntityDescription(
+        key="panel_version",
+        name="Panel Version",
+        device_class=None,
+        state_class=None,
+    ),
+    SensorEntityDescription(
+        key="panel_device_id",
+        name="Panel Device ID",
+        device_class=None,
+        state_class=None,
+    ),
+    SensorEntityDescription(
+        key="panel_sn",
+        name="Panel Serial Number",
+        device_class=None,
+        state_class=None,
+    ),
+    SensorEntityDescription(
+        key="panel_cfgtime",
+        name="Panel Configuration Time",
+        device_class=None,
+        state_class=None,
+    ),
+    SensorEntityDescription(
+        key="panel_hw_ver_major",
+        name="Panel Hardware Version Major",
+        device_class=None,
+        state_class=None,
+    ),
+    SensorEntityDescription(
+        key="panel_hw_ver_minor",
+        name="Panel Hardware Version Minor",
+        device_class=None,
+        state_class=None,
+    ),
+    SensorEntityDescription(
+        key="panel_hw_ver_vds",
+        name="Panel Hardware Version VDS",
+        device_class=None,
+        state_class=None,
+    ),
+    SensorEntityDescription(
+        key="panel_license_key",
+        name="Panel License Key",
+        device_class=None,
+        state_class=None,
+    ),
+]
+
+XBUS_SENSORS = [
+    SensorEntityDescription(
+        key="xbus_status",
+        name="X-BUS Status",
+        icon="mdi:network",
+    ),
+    SensorEntityDescription(
+        key="xbus_voltage",
+        name="X-BUS Voltage",
+        device_class=SensorDeviceClass.VOLTAGE,
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+]
+
+SYSTEM_SENSOR_TYPES = [
+    SensorEntityDescription(
+        key="system_time",
+        name="System Time",
+        device_class=None,
+        state_class=None,
+    ),
+    SensorEntityDescription(
+        key="system_engmode",
+        name="Engineering Mode",
+        device_class=None,
+        state_class=None,
+    ),
+    SensorEntityDescription(
+        key="system_rf_type",
+        name="RF Type",
+        device_class=None,
+        state_class=None,
+    ),
+    SensorEntityDescription(
+        key="system_rf_version",
+        name="RF Version",
+        device_class=None,
+        state_class=None,
+    ),
+]
+
+MODEM_SENSOR_TYPES = [
+    SensorEntityDescription(
+        key="port",
+        name="Port",
+        icon="mdi:port",
+    ),
+    SensorEntityDescription(
+        key="enabled",
+        name="Enabled",
+        icon="mdi:power",
+    ),
+    SensorEntityDescription(
+        key="status",
+        name="Status",
+        icon="mdi:information",
+    ),
+    SensorEntityDescription(
+        key="state",
+        name="State",
+        icon="mdi:state-machine",
+    ),
+    SensorEntityDescription(
+        key="type",
+        name="Type",
+        icon="mdi:cellphone-link",
+    ),
+    SensorEntityDescription(
+        key="id_type",
+        name="Model",
+        icon="mdi:radio-tower",
+    ),
+    SensorEntityDescription(
+        key="id_fw",
+        name="Firmware",
+        icon="mdi:firmware",
+    ),
+    SensorEntityDescription(
+        key="id_hw",
+        name="Hardware Version",
+        icon="mdi:circuit-board",
+    ),
+    SensorEntityDescription(
+        key="capabilities",
+        name="Capabilities",
+        icon="mdi:feature-search",
+    ),
+    SensorEntityDescription(
+        key="gsm_signal",
+        name="GSM Signal",
+        icon="mdi:signal",
+        native_unit_of_measurement="bars",
+    ),
+    SensorEntityDescription(
+        key="incoming_time",
+        name="Incoming Time",
+        icon="mdi:timer-outline",
+    ),
+    SensorEntityDescription(
+        key="incoming_count",
+        name="Incoming Count",
+        icon="mdi:counter",
+    ),
+    SensorEntityDescription(
+        key="outgoing_time",
+        name="Outgoing Time",
+        icon="mdi:timer",
+    ),
+    SensorEntityDescription(
+        key="outgoing_count",
+        name="Outgoing Count",
+        icon="mdi:counter",
+    ),
+    SensorEntityDescription(
+        key="outgoing_failed",
+        name="Failed Outgoing",
+        icon="mdi:alert-circle",
+    ),
+    SensorEntityDescription(
+        key="incoming_sms_count",
+        name="Incoming SMS",
+        icon="mdi:message-incoming",
+    ),
+    SensorEntityDescription(
+        key="outgoing_sms_count",
+        name="Outgoing SMS",
+        icon="mdi:message-outgoing",
+    ),
+]
+
+# Add this new constant after other sensor type definitions
+ETHERNET_SENSOR_TYPES = [
+    SensorEntityDescription(
+        key="fitted",
+        name="Ethernet Fitted",
+        icon="mdi:ethernet",
+    ),
+    SensorEntityDescription(
+        key="state",
+        name="Ethernet State",
+        icon="mdi:ethernet",
+    ),
+    SensorEntityDescription(
+        key="dhcp_enabled",
+        name="DHCP Enabled",
+        icon="mdi:ip-network",
+    ),
+    SensorEntityDescription(
+        key="mac_address",
+        name="MAC Address",
+        icon="mdi:ethernet",
+    ),
+    SensorEntityDescription(
+        key="ip_address",
+        name="IP Address",
+        icon="mdi:ip",
+    ),
+    SensorEntityDescription(
+        key="netmask",
+        name="Network Mask",
+        icon="mdi:ip-network",
+    ),
+    SensorEntityDescription(
+        key="gateway",
+        name="Gateway",
+        icon="mdi:router-network",
+    ),
+    SensorEntityDescription(
+        key="tx_packets",
+        name="Transmitted Packets",
+        icon="mdi:upload-network",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    SensorEntityDescription(
+        key="tx_bytes",
+        name="Transmitted Bytes",
+        icon="mdi:upload-network",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement="bytes",
+    ),
+    SensorEntityDescription(
+        key="rx_packets",
+        name="Received Packets",
+        icon="mdi:download-network",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    SensorEntityDescription(
+        key="rx_bytes",
+        name="Received Bytes",
+        icon="mdi:download-network",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement="bytes",
+    ),
+]
+
+# Add this new constant after other sensor type definitions
+AREA_SENSOR_TYPES = [
+    SensorEntityDescription(
+        key="mode",
+        name="Mode",
+        icon="mdi:security",
+    ),
+    SensorEntityDescription(
+        key="last_set_time",
+        name="Last Set Time",
+        icon="mdi:clock",
+    ),
+    SensorEntityDescription(
+        key="last_unset_time",
+        name="Last Unset Time",
+        icon="mdi:clock",
+    ),
+    SensorEntityDescription(
+        key="last_set_user_id",
+        name="Last Set User ID",
+        icon="mdi:account",
+    ),
+    SensorEntityDescription(
+        key="last_set_user_name",
+        name="Last Set User Name",
+        icon="mdi:account",
+    ),
+    SensorEntityDescription(
+        key="last_unset_user_id",
+        name="Last Unset User ID",
+        icon="mdi:account",
+    ),
+    SensorEntityDescription(
+        key="last_unset_user_name",
+        name="Last Unset User Name",
+        icon="mdi:account",
+    ),
+    SensorEntityDescription(
+        key="last_alarm",
+        name="Last Alarm",
+        icon="mdi:alarm",
+    ),
+]
+
+# Add this new constant after other sensor type definitions
+XBUS_NODE_SENSOR_TYPES = [
+    SensorEntityDescription(
+        key="aux_volt",
+        name="Auxiliary Voltage",
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="aux_curr",
+        name="Auxiliary Current",
+        native_unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="psu_out1_volt",
+        name="PSU Output 1 Voltage",
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="psu_out1_curr",
+        name="PSU Output 1 Current",
+        native_unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="psu_out2_volt",
+        name="PSU Output 2 Voltage",
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="psu_out2_curr",
+        name="PSU Output 2 Current",
+        native_unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="psu_out3_volt",
+        name="PSU Output 3 Voltage",
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="psu_out3_curr",
+        name="PSU Output 3 Current",
+        native_unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="psu_batt_volt",
+        name="PSU Battery Voltage",
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="psu_batt_curr",
+        name="PSU Battery Current",
+        native_unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+]
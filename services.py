@@ -0,0 +1,167 @@
+"""Services for acre Intrusion."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from homeassistant.components.lock import DOMAIN as LOCK_DOMAIN
+from homeassistant.components.switch import DOMAIN as SWITCH_DOMAIN
+from homeassistant.const import ATTR_AREA_ID, ATTR_DEVICE_ID, ATTR_ENTITY_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.helpers.service import async_extract_entity_ids
+
+from .const import (
+    ATTR_STATE,
+    DOMAIN,
+    SERVICE_LOCK_DOORS,
+    SERVICE_SET_OUTPUTS,
+    SERVICE_UNLOCK_DOORS,
+    SOURCE_OUTPUTS,
+)
+from .runtime import get_runtime
+
+if TYPE_CHECKING:
+    from .lock import SpcDoorLock
+    from .outputs import OutputCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+TARGET_KEYS = (ATTR_ENTITY_ID, ATTR_DEVICE_ID, ATTR_AREA_ID)
+
+SET_OUTPUTS_SCHEMA = cv.make_entity_service_schema(
+    {vol.Required(ATTR_STATE): cv.boolean}
+)
+LOCK_DOORS_SCHEMA = cv.make_entity_service_schema({})
+UNLOCK_DOORS_SCHEMA = vol.All(
+    cv.make_entity_service_schema({}), cv.has_at_least_one_key(*TARGET_KEYS)
+)
+
+
+def _resolve_targets(
+    hass: HomeAssistant, entity_ids: set[str], domain: str, kind: str
+) -> dict[str, dict[str, str]]:
+    """Group SPC entities by config entry, mapping panel object id to entity id."""
+    registry = er.async_get(hass)
+    targets: dict[str, dict[str, str]] = {}
+    for entity_id in sorted(entity_ids):
+        entry = registry.async_get(entity_id)
+        if (
+            entry is None
+            or entry.platform != DOMAIN
+            or entry.domain != domain
+            or entry.config_entry_id is None
+            or (runtime := get_runtime(hass, entry.config_entry_id)) is None
+        ):
+            _LOGGER.warning("%s is not an SPC %s", entity_id, kind)
+            continue
+        prefix = runtime.panel.unique_id(f"{kind}_")
+        if not entry.unique_id.startswith(prefix):
+            _LOGGER.warning("%s is not an SPC %s", entity_id, kind)
+            continue
+        targets.setdefault(entry.config_entry_id, {})[
+            entry.unique_id.removeprefix(prefix)
+        ] = entity_id
+    return targets
+
+
+async def _async_target_locks(
+    hass: HomeAssistant, call: ServiceCall
+) -> list[SpcDoorLock]:
+    """Return the targeted door locks, or every door lock without a target."""
+    if not any(key in call.data for key in TARGET_KEYS):
+        return [
+            lock
+            for runtime in hass.data.get(DOMAIN, {}).values()
+            for lock in runtime.locks.values()
+        ]
+    entity_ids = await async_extract_entity_ids(hass, call)
+    return [
+        lock
+        for entry_id, doors in _resolve_targets(
+            hass, entity_ids, LOCK_DOMAIN, "door"
+        ).items()
+        for door_id in doors
+        if (lock := get_runtime(hass, entry_id).locks.get(door_id)) is not None
+    ]
+
+
+async def _async_door_command(
+    locks: list[SpcDoorLock], unlock: bool
+) -> dict[str, Any]:
+    """Lock or unlock doors concurrently and report the result per lock."""
+
+    async def run(lock: SpcDoorLock) -> tuple[str, dict[str, Any]]:
+        try:
+            if unlock:
+                await lock.async_unlock()
+            else:
+                await lock.async_lock()
+        except HomeAssistantError as err:
+            return lock.entity_id, {"success": False, "error": str(err)}
+        return lock.entity_id, {"success": True}
+
+    return {"doors": dict(await asyncio.gather(*(run(lock) for lock in locks)))}
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+
+    async def async_set_outputs(call: ServiceCall) -> ServiceResponse:
+        """Switch a set of outputs with a single confirmation refresh."""
+        on = call.data[ATTR_STATE]
+        entity_ids = await async_extract_entity_ids(hass, call)
+        results: dict[str, dict[str, bool]] = {}
+        for entry_id, outputs in _resolve_targets(
+            hass, entity_ids, SWITCH_DOMAIN, "output"
+        ).items():
+            coordinator: OutputCoordinator = get_runtime(hass, entry_id).coordinators[
+                SOURCE_OUTPUTS
+            ]
+            sent = await coordinator.async_set_outputs(list(outputs), on)
+            for output_id, entity_id in outputs.items():
+                results[entity_id] = {
+                    "sent": sent[output_id],
+                    "confirmed": coordinator.last_update_success
+                    and coordinator.states.get(output_id) is on,
+                }
+        return {"outputs": results}
+
+    async def async_lock_doors(call: ServiceCall) -> ServiceResponse:
+        """Lock the targeted doors, or all doors, concurrently."""
+        return await _async_door_command(await _async_target_locks(hass, call), False)
+
+    async def async_unlock_doors(call: ServiceCall) -> ServiceResponse:
+        """Unlock a group of doors concurrently."""
+        return await _async_door_command(await _async_target_locks(hass, call), True)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_OUTPUTS,
+        async_set_outputs,
+        schema=SET_OUTPUTS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_LOCK_DOORS,
+        async_lock_doors,
+        schema=LOCK_DOORS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_UNLOCK_DOORS,
+        async_unlock_doors,
+        schema=UNLOCK_DOORS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,344 @@
+"""Verification image snapshots for acre Intrusion."""
+from __future__ import annotations
+
+import asyncio
+import binascii
+from collections import OrderedDict
+from collections.abc import Hashable
+from datetime import datetime
+import hashlib
+from http import HTTPStatus
+import io
+import json
+import logging
+import re
+import time
+
+import aiohttp
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+# Frames with more base64 than this are decoded in the executor
+OFFLOAD_THRESHOLD = 256 * 1024
+
+# Frames whose average hashes differ in at most this many bits look the same
+PHASH_THRESHOLD = 5
+
+# Leading bytes of a snapshot response read to tell whether it has an image
+PROBE_BYTES = 1024
+
+RESIZE_CACHE_SIZE = 32
+RESIZE_QUALITY = 75
+
+_IMAGE_KEY = re.compile(rb'"image"\s*:\s*\{')
+_DATA_KEY = re.compile(rb'"data"\s*:\s*"')
+_STATUS_SUCCESS = re.compile(rb'"status"\s*:\s*"success"')
+
+
+def find_image_data(body: bytes) -> tuple[int, int] | None:
+    """Locate the base64 image.data string in a raw snapshot response.
+
+    Returns the start and end offsets of the string contents, so the caller
+    can decode it straight from the response body without parsing the JSON.
+    """
+    image = _IMAGE_KEY.search(body)
+    if image is None:
+        return None
+    data = _DATA_KEY.search(body, image.end())
+    if data is None:
+        return None
+    start = data.end()
+    end = body.find(b'"', start)
+    if end == -1:
+        return None
+    if not (
+        _STATUS_SUCCESS.search(body, 0, start) or _STATUS_SUCCESS.search(body, end)
+    ):
+        return None
+    return start, end
+
+
+async def async_probe_image(session: aiohttp.ClientSession, url: str) -> bool | None:
+    """Return whether a snapshot endpoint serves an image, without downloading it.
+
+    Asks for the first PROBE_BYTES only and reads no more even if the gateway
+    ignores the range. Returns None when the gateway could not be reached, so
+    the caller can tell a missing image from a failed probe.
+    """
+    try:
+        async with session.get(
+            url, headers={aiohttp.hdrs.RANGE: f"bytes=0-{PROBE_BYTES - 1}"}
+        ) as response:
+            if response.status not in (HTTPStatus.OK, HTTPStatus.PARTIAL_CONTENT):
+                return False
+            head = await response.content.read(PROBE_BYTES)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+        _LOGGER.debug("Error probing camera image at %s: %s", url, err)
+        return None
+    return _IMAGE_KEY.search(head) is not None
+
+
+def decode_image_data(body: bytes, start: int, end: int) -> bytes:
+    """Decode the base64 string at body[start:end] into a single buffer."""
+    # Non-alphabet characters, such as the backslash of an escaped "\/",
+    # are skipped by the decoder, so the slice never needs unescaping.
+    return binascii.a2b_base64(memoryview(body)[start:end])
+
+
+def average_hash(image: bytes) -> int:
+    """Return a 64-bit perceptual average hash of an image."""
+    from PIL import Image  # Only needed when perceptual hashing is enabled
+
+    with Image.open(io.BytesIO(image)) as img:
+        img.draft("L", (64, 64))
+        pixels = list(img.convert("L").resize((8, 8)).getdata())
+    mean = sum(pixels) / len(pixels)
+    bits = 0
+    for pixel in pixels:
+        bits = bits << 1 | (pixel > mean)
+    return bits
+
+
+def scale_image(image: bytes, width: int | None, height: int | None) -> bytes:
+    """Downscale an image to fit within width x height, keeping its aspect ratio."""
+    from PIL import Image  # Only needed when a size is requested
+
+    with Image.open(io.BytesIO(image)) as img:
+        target = (width or img.width, height or img.height)
+        if img.width <= target[0] and img.height <= target[1]:
+            return image
+        img.thumbnail(target)
+        output = io.BytesIO()
+        img.convert("RGB").save(output, format="JPEG", quality=RESIZE_QUALITY)
+        return output.getvalue()
+
+
+class ResizeCache:
+    """LRU cache of downscaled snapshots, computed in the executor.
+
+    Entries are keyed by zone, image version and requested size, so each
+    thumbnail size is computed once per new frame and concurrent requests
+    for the same thumbnail share one resize job.
+    """
+
+    def __init__(self, hass: HomeAssistant, capacity: int = RESIZE_CACHE_SIZE) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self._capacity = capacity
+        self._entries: OrderedDict[Hashable, bytes] = OrderedDict()
+        self._pending: dict[Hashable, asyncio.Future] = {}
+
+    async def async_get(
+        self,
+        zone_id: str,
+        version: int,
+        image: bytes,
+        width: int | None,
+        height: int | None,
+    ) -> bytes:
+        """Return the image scaled to the requested size."""
+        key = (zone_id, version, width, height)
+        if (scaled := self._entries.get(key)) is not None:
+            self._entries.move_to_end(key)
+            return scaled
+
+        if (pending := self._pending.get(key)) is not None:
+            return await asyncio.shield(pending)
+
+        pending = self.hass.async_add_executor_job(scale_image, image, width, height)
+        self._pending[key] = pending
+        try:
+            scaled = await asyncio.shield(pending)
+        except Exception as err:
+            _LOGGER.warning("Could not resize camera image: %s", err)
+            scaled = image
+        finally:
+            self._pending.pop(key, None)
+
+        self._entries[key] = scaled
+        if len(self._entries) > self._capacity:
+            self._entries.popitem(last=False)
+        return scaled
+
+
+class SnapshotCache:
+    """Cache the latest snapshot of one zone camera.
+
+    Fresh images are served from memory for ttl seconds. Concurrent requests
+    share a single in-flight fetch, and once an image is cached a stale copy
+    is returned immediately while the refresh runs in the background.
+
+    A fetched frame whose digest matches the cached one, or optionally whose
+    perceptual hash is within PHASH_THRESHOLD bits, keeps the current
+    version and ETag, so unchanged frames are never pushed to clients again.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        session: aiohttp.ClientSession,
+        url: str,
+        ttl: float,
+        perceptual: bool = False,
+    ) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self._session = session
+        self._url = url
+        self.ttl = ttl
+        self.perceptual = perceptual
+        self.etag: str | None = None
+        self.last_changed: datetime | None = None
+        self.fetched_at: datetime | None = None
+        self._phash: int | None = None
+        self._frame: tuple[int, bytes] | None = None
+        self._version = 0
+        self._fetched = 0.0
+        self._refresh: asyncio.Task | None = None
+
+    @property
+    def frame(self) -> tuple[int, bytes] | None:
+        """Return the cached image with its version without fetching."""
+        return self._frame
+
+    @property
+    def image(self) -> bytes | None:
+        """Return the cached image without fetching."""
+        return self._frame[1] if self._frame else None
+
+    @property
+    def is_fresh(self) -> bool:
+        """Return true if the cached image is within its TTL."""
+        return self._frame is not None and time.monotonic() - self._fetched < self.ttl
+
+    async def async_get(self) -> bytes | None:
+        """Return the current image, refreshing it if stale."""
+        frame = await self.async_get_frame()
+        return frame[1] if frame else None
+
+    async def async_get_frame(self) -> tuple[int, bytes] | None:
+        """Return the current image with its version, refreshing it if stale."""
+        if self.is_fresh:
+            return self._frame
+
+        if self._refresh is None:
+            self._refresh = self.hass.async_create_task(self._async_refresh())
+        if self._frame is not None:
+            return self._frame
+        return await asyncio.shield(self._refresh)
+
+    async def async_refresh_frame(self) -> tuple[int, bytes] | None:
+        """Fetch a new image now, joining a refresh already in flight."""
+        if self._refresh is None:
+            self._refresh = self.hass.async_create_task(self._async_refresh())
+        return await asyncio.shield(self._refresh)
+
+    async def _async_refresh(self) -> tuple[int, bytes] | None:
+        """Fetch a new image and store it in the cache."""
+        try:
+            image = await self._async_fetch()
+            if image is not None:
+                self._fetched = time.monotonic()
+                self.fetched_at = dt_util.utcnow()
+                await self._async_store(image)
+            return self._frame
+        finally:
+            self._refresh = None
+
+    async def _async_store(self, image: bytes) -> None:
+        """Replace the cached frame if the new one differs."""
+        digest = hashlib.blake2b(image, digest_size=16).hexdigest()
+        if self._frame is not None and digest == self.etag:
+            return
+
+        if self.perceptual:
+            try:
+                phash = await self.hass.async_add_executor_job(average_hash, image)
+            except Exception as err:
+                _LOGGER.debug("Could not hash camera image: %s", err)
+                phash = None
+            if (
+                self._frame is not None
+                and phash is not None
+                and self._phash is not None
+                and (phash ^ self._phash).bit_count() <= PHASH_THRESHOLD
+            ):
+                return
+            self._phash = phash
+
+        self.etag = digest
+        self._version += 1
+        self._frame = (self._version, image)
+        self.last_changed = dt_util.utcnow()
+
+    async def _async_fetch(self) -> bytes | None:
+        """Fetch and decode the snapshot from the gateway."""
+        try:
+            _LOGGER.debug("Fetching camera image from: %s", self._url)
+            async with self._session.get(self._url) as response:
+                if response.status != 200:
+                    return None
+                body = await response.read()
+        except Exception as err:
+            _LOGGER.error("Error getting camera image: %s", err)
+            return None
+
+        span = find_image_data(body)
+        if span is None:
+            return self._decode_json(body)
+
+        start, end = span
+        try:
+            if end - start > OFFLOAD_THRESHOLD:
+                return await self.hass.async_add_executor_job(
+                    decode_image_data, body, start, end
+                )
+            return decode_image_data(body, start, end)
+        except binascii.Error as err:
+            _LOGGER.error("Error decoding camera image: %s", err)
+            return None
+
+    def _decode_json(self, body: bytes) -> bytes | None:
+        """Decode a snapshot the byte scanner did not recognise."""
+        try:
+            data = json.loads(body)
+        except ValueError:
+            return None
+
+        if (data.get("status") == "success" and
+            "data" in data and
+            "image" in data["data"] and
+            "data" in data["data"]["image"]):
+            return binascii.a2b_base64(data["data"]["image"]["data"])
+        return None
+
+
+class SnapshotView(HomeAssistantView):
+    """Serve camera snapshots with ETags, answering not-modified when unchanged."""
+
+    url = "/api/acre_intrusion/snapshot/{entity_id}"
+    name = "api:acre_intrusion:snapshot"
+
+    def __init__(self, cameras: dict) -> None:
+        """Initialize the view with the registered cameras by entity id."""
+        self._cameras = cameras
+
+    async def get(self, request: web.Request, entity_id: str) -> web.Response:
+        """Return the current snapshot, or 304 if the client already has it."""
+        if (camera := self._cameras.get(entity_id)) is None:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+        snapshots: SnapshotCache = camera.snapshots
+        frame = await snapshots.async_get_frame()
+        if frame is None:
+            return web.Response(status=HTTPStatus.SERVICE_UNAVAILABLE)
+
+        etag = f'"{snapshots.etag}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+        return web.Response(body=frame[1], content_type="image/jpeg", headers=headers)
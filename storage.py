@@ -2,30 +2,58 @@
 from homeassistant.helpers.storage import Store
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+import asyncio
 import hashlib
 import base64
+import logging
 import os
 
-from .const import STORAGE_KEY, STORAGE_VERSION
+from .const import DOMAIN, STORAGE_KEY, STORAGE_KEY_ENTRY, STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+# Held while the PINs of the former single store move to an entry
+_MIGRATE_LOCK = asyncio.Lock()
+
 
 class PinStorage:
-    """Class to handle PIN storage."""
+    """Class to handle PIN storage of one config entry."""
 
-    def __init__(self, hass: HomeAssistant) -> None:
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
         """Initialize the storage."""
         self.hass = hass
-        self.store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._entry_id = entry_id
+        self.store = Store(hass, STORAGE_VERSION, STORAGE_KEY_ENTRY.format(entry_id))
         self._data = {}
 
     async def async_load(self) -> None:
         """Load pins."""
-        self._data = await self.store.async_load() or {}
+        data = await self.store.async_load()
+        if data is None:
+            data = await self._async_migrate_legacy()
+        self._data = data or {}
+
+    async def _async_migrate_legacy(self) -> dict | None:
+        """Take over the PINs of the shared store if this is the first entry."""
+        entries = self.hass.config_entries.async_entries(DOMAIN)
+        if not entries or entries[0].entry_id != self._entry_id:
+            return None
+        async with _MIGRATE_LOCK:
+            legacy = Store(self.hass, STORAGE_VERSION, STORAGE_KEY)
+            data = await legacy.async_load()
+            if data is None:
+                return None
+            await self.store.async_save(data)
+            await legacy.async_remove()
+        _LOGGER.info("Moved stored PINs to config entry %s", self._entry_id)
+        return data
 
     async def async_save(self) -> None:
         """Save pins."""
         await self.store.async_save(self._data)
 
-    def _hash_pin(self, pin: str, salt: str = None) -> tuple[str, str]:
+    @staticmethod
+    def _hash_pin(pin: str, salt: str = None) -> tuple[str, str]:
         """Hash a PIN with salt."""
         if salt is None:
             salt = base64.b64encode(os.urandom(16)).decode('utf-8')
@@ -94,11 +122,20 @@ class PinStorage:
 
     async def async_store_admin_pin(self, pin: str) -> None:
         """Store admin PIN."""
-        pin_hash, salt = self._hash_pin(pin)
-        self._data['admin'] = {
+        await self.async_store_admin_record(self.admin_pin_record(pin))
+
+    @staticmethod
+    def admin_pin_record(pin: str) -> dict[str, str]:
+        """Return the hashed record of an admin PIN."""
+        pin_hash, salt = PinStorage._hash_pin(pin)
+        return {
             'pin_hash': pin_hash,
             'salt': salt
         }
+
+    async def async_store_admin_record(self, record: dict[str, str]) -> None:
+        """Store an already hashed admin PIN."""
+        self._data['admin'] = dict(record)
         await self.async_save()
 
     def get_user_pins(self) -> dict[str, dict]:
@@ -1,21 +1,23 @@
 """Support for Acre SPC outputs."""
 from __future__ import annotations
 
+from functools import partial
 import logging
 from typing import Any
 
-from pyspcwebgw import SpcWebGateway
-
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import STATE_ON
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers import aiohttp_client
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from datetime import timedelta
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from . import DATA_API
-from .const import CONF_API_URL, DATA_API, DOMAIN
+from .const import SIGNAL_TOPOLOGY_UPDATED, SOURCE_OUTPUTS
+from .outputs import OutputCoordinator
+from .runtime import SpcPanel, SpcRuntimeData, get_runtime
+from .topology import EntitySync
+from .warm_start import RestoredStateEntity, WarmStartEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,104 +25,108 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up SPC outputs from config entry."""
-    api: SpcWebGateway = hass.data[DATA_API]
-    session = aiohttp_client.async_get_clientsession(hass)
-    api_ip = entry.data[CONF_API_URL].split("//")[-1].split("/")[0]  # Extract IP address from API URL
-    
-    async def async_update_data():
-        """Fetch data from API."""
-        try:
-            async with session.get(f"{api._api_url}/spc/output") as resp:
-                if resp.status == 200:
-                    output_data = await resp.json()
-                    if (output_data.get("status") == "success" 
-                        and "data" in output_data 
-                        and "output" in output_data["data"]):
-                        return output_data["data"]["output"]
-        except Exception as err:
-            raise UpdateFailed(f"Error fetching data: {err}")
-
-    coordinator = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name="spc_output",
-        update_method=async_update_data,
-        update_interval=timedelta(seconds=30),
-    )
+    runtime: SpcRuntimeData = get_runtime(hass, entry.entry_id)
+    coordinator = OutputCoordinator(hass, runtime.api, runtime.pool.session)
+    runtime.coordinators[SOURCE_OUTPUTS] = coordinator
+
+    warm_start = runtime.warm_start
+    if (stored := warm_start.get(SOURCE_OUTPUTS)) is not None:
+        coordinator.data = stored
+
+    @callback
+    def _async_store_data() -> None:
+        """Keep the stored output states up to date."""
+        if coordinator.last_update_success:
+            warm_start.async_update(SOURCE_OUTPUTS, coordinator.data)
 
-    await coordinator.async_refresh()
+    entry.async_on_unload(coordinator.async_add_listener(_async_store_data))
 
-    outputs = []
-    for output in coordinator.data:
-        if output.get("name"):  # Only add outputs with a name
-            outputs.append(
-                SpcSwitch(
+    sync = EntitySync(hass, async_add_entities)
+
+    async def async_sync_outputs() -> None:
+        """Create a switch for every named output."""
+        await sync.async_sync(
+            {
+                output.get("id"): partial(
+                    SpcSwitch,
                     coordinator=coordinator,
                     output_id=output.get("id"),
                     name=output.get("name"),
-                    api=api,
-                    session=session,
-                    state=output.get("state") == "1",
-                    api_ip=api_ip
+                    panel=runtime.panel,
                 )
-            )
-    
-    if outputs:
-        async_add_entities(outputs)
+                for output in coordinator.data or []
+                if output.get("name")  # Only add outputs with a name
+            }
+        )
+
+    async def async_topology_updated() -> None:
+        """Re-read the outputs after the panel configuration changed."""
+        await coordinator.async_refresh()
+        await async_sync_outputs()
+
+    async def async_prime() -> None:
+        """Fetch the first output states and add the outputs they reveal."""
+        await coordinator.async_refresh()
+        runtime.record_timing("outputs_primed")
+        await async_sync_outputs()
 
-class SpcSwitch(SwitchEntity):
+    await async_sync_outputs()
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            SIGNAL_TOPOLOGY_UPDATED.format(entry.entry_id),
+            async_topology_updated,
+        )
+    )
+    entry.async_create_background_task(
+        hass, async_prime(), "acre_intrusion output refresh"
+    )
+
+class SpcSwitch(
+    RestoredStateEntity,
+    WarmStartEntity,
+    CoordinatorEntity[OutputCoordinator],
+    SwitchEntity,
+):
     """Representation of a SPC output."""
 
-    def __init__(self, coordinator: DataUpdateCoordinator, output_id: str, name: str, api: SpcWebGateway, session: aiohttp.ClientSession, state: bool, api_ip: str) -> None:
+    _warm_start_source = SOURCE_OUTPUTS
+
+    def __init__(
+        self,
+        coordinator: OutputCoordinator,
+        output_id: str,
+        name: str,
+        panel: SpcPanel,
+    ) -> None:
         """Initialize the switch."""
-        self.coordinator = coordinator
+        super().__init__(coordinator)
         self._output_id = output_id
-        self._api = api
-        self._session = session
-        self._base_url = api._api_url  # Store base URL at init
         self._attr_name = name
-        self._attr_unique_id = f"acre_intrusion_output_{output_id}"
-        self._state = state
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, api_ip)},
-            "name": f"SPC Panel ({api_ip})",
-            "manufacturer": "Vanderbilt",
-            "model": "SPC Output",
-        }
+        self._panel = panel
+        self._attr_unique_id = panel.unique_id(f"output_{output_id}")
+        self._attr_device_info = panel.device_info("SPC Output")
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the output on."""
-        try:
-            async with self._session.put(
-                f"{self._base_url}/spc/output/{self._output_id}/set"
-            ) as resp:
-                if resp.status == 200:
-                    self._state = True
-                    await self.coordinator.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error("Failed to turn on output %s: %s", self._output_id, err)
+        if await self.coordinator.async_set_output(self._output_id, True):
+            await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the output off."""
-        try:
-            async with self._session.put(
-                f"{self._base_url}/spc/output/{self._output_id}/reset"
-            ) as resp:
-                if resp.status == 200:
-                    self._state = False
-                    await self.coordinator.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error("Failed to turn off output %s: %s", self._output_id, err)
+        if await self.coordinator.async_set_output(self._output_id, False):
+            await self.coordinator.async_request_refresh()
+
+    @property
+    def _has_live_state(self) -> bool:
+        """Return true once the output list holds the output."""
+        return self._output_id in self.coordinator.states
 
     @property
-    def is_on(self) -> bool:
+    def is_on(self) -> bool | None:
         """Return true if output is on."""
-        return self._state
-
-    async def async_update(self) -> None:
-        """Update output state."""
-        await self.coordinator.async_request_refresh()
-        for output in self.coordinator.data:
-            if output["id"] == self._output_id:
-                self._state = output["state"] == "1"
-                break
+        if (state := self.coordinator.states.get(self._output_id)) is not None:
+            return state
+        if self._restored_state is None:
+            return None
+        return self._restored_state == STATE_ON
@@ -0,0 +1,111 @@
+"""Live panel topology changes for acre Intrusion."""
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+import logging
+
+from pyspcwebgw import SpcWebGateway
+from pyspcwebgw.area import Area
+from pyspcwebgw.zone import Zone
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def apply_topology_changes(
+    spc: SpcWebGateway, topology: dict[str, list]
+) -> tuple[list[Area | Zone], list[Area | Zone]]:
+    """Add and drop areas and zones so the gateway matches the topology.
+
+    Returns the added and the removed objects. Objects that are still
+    configured are left in place so their entities keep working; a zone
+    moved to another area is rebuilt and reported as removed and added.
+    """
+    areas, zones = spc.areas, spc.zones
+    added: list[Area | Zone] = []
+    removed: list[Area | Zone] = []
+
+    area_data = {data["id"]: data for data in topology["area"]}
+    zone_data = {
+        data["id"]: data for data in topology["zone"] if data.get("area") in area_data
+    }
+
+    for zone_id in [
+        zone_id
+        for zone_id, zone in zones.items()
+        if zone_id not in zone_data or zone_data[zone_id]["area"] != zone.area.id
+    ]:
+        zone = zones.pop(zone_id)
+        if zone in zone.area.zones:
+            zone.area.zones.remove(zone)
+        removed.append(zone)
+    for area_id in [area_id for area_id in areas if area_id not in area_data]:
+        removed.append(areas.pop(area_id))
+
+    for area_id, data in area_data.items():
+        if area_id not in areas:
+            area = Area(spc, data)
+            area.zones = []
+            areas[area_id] = area
+            added.append(area)
+    for zone_id, data in zone_data.items():
+        if zone_id not in zones:
+            area = areas[data["area"]]
+            zone = Zone(area, data)
+            area.zones.append(zone)
+            zones[zone_id] = zone
+            added.append(zone)
+
+    return added, removed
+
+
+async def async_remove_entity(hass: HomeAssistant, entity: Entity) -> None:
+    """Remove an entity together with its registry entry."""
+    if entity.registry_entry is not None:
+        er.async_get(hass).async_remove(entity.entity_id)
+    else:
+        await entity.async_remove(force_remove=True)
+
+
+class EntitySync:
+    """Keep a platform's entities in step with the configured objects.
+
+    Entities are keyed by the object they represent. Syncing creates
+    entities for new keys and removes those whose key went away, leaving
+    every other entity untouched. An entity replaced by one with the same
+    unique id, such as a zone rebuilt in another area, keeps its registry
+    entry so user customizations survive.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, async_add_entities: AddEntitiesCallback
+    ) -> None:
+        """Initialize the sync."""
+        self.hass = hass
+        self._async_add_entities = async_add_entities
+        self.entities: dict[Hashable, Entity] = {}
+
+    async def async_sync(self, factories: dict[Hashable, Callable[[], Entity]]) -> None:
+        """Add entities for new keys and remove the ones no longer wanted."""
+        new_entities = {
+            key: factory()
+            for key, factory in factories.items()
+            if key not in self.entities
+        }
+        replacing = {entity.unique_id for entity in new_entities.values()}
+
+        for key in [key for key in self.entities if key not in factories]:
+            entity = self.entities.pop(key)
+            if entity.unique_id in replacing:
+                await entity.async_remove(force_remove=True)
+            else:
+                await async_remove_entity(self.hass, entity)
+            _LOGGER.debug("Removed entity for %s", key)
+
+        if new_entities:
+            self.entities.update(new_entities)
+            self._async_add_entities(list(new_entities.values()))
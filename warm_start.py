@@ -0,0 +1,221 @@
+"""Warm-start snapshot of panel topology and telemetry for acre Intrusion."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from pyspcwebgw import SpcWebGateway
+
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    SIGNAL_WARM_START_FRESH,
+    SNAPSHOT_STORAGE_KEY,
+    SNAPSHOT_STORAGE_VERSION,
+    SOURCE_TOPOLOGY,
+)
+from .runtime import SpcPanel, get_runtime
+from .topology import apply_topology_changes
+
+_LOGGER = logging.getLogger(__name__)
+
+SAVE_DELAY = 30  # seconds
+
+TOPOLOGY_RESOURCES = ("area", "zone", "panel")
+STATE_RESOURCES = ("area", "zone")
+
+
+async def async_fetch_topology(
+    spc: SpcWebGateway,
+    resources: tuple[str, ...] = TOPOLOGY_RESOURCES,
+    known: dict[str, Any] | None = None,
+) -> dict[str, list] | None:
+    """Fetch the raw area and zone lists and panel details from the gateway.
+
+    Resources already in known are taken from there instead.
+    """
+    topology = dict(known or {})
+    for resource in resources:
+        if resource in topology:
+            continue
+        data = await spc._async_get_data(resource)
+        if not data:
+            return None
+        topology[resource] = data
+    return topology
+
+
+def load_topology(spc: SpcWebGateway, topology: dict[str, list]) -> bool:
+    """Build the gateway's areas and zones from an already fetched topology."""
+    if not topology.get("area") or not topology.get("zone"):
+        return False
+    apply_topology_changes(spc, topology)
+    return True
+
+
+def _area_state(area) -> tuple:
+    """Return the fields of an area that entities show."""
+    return (area.mode, area.last_changed_by, area.verified_alarm)
+
+
+def _zone_state(zone) -> tuple:
+    """Return the fields of a zone that entities show."""
+    return (zone.input, zone.status)
+
+
+def apply_topology_states(spc: SpcWebGateway, topology: dict[str, list]) -> list:
+    """Update areas and zones in place and return the objects that changed."""
+    changed = []
+    for resource, objects, state in (
+        ("area", spc.areas, _area_state),
+        ("zone", spc.zones, _zone_state),
+    ):
+        for data in topology.get(resource, []):
+            spc_object = objects.get(data.get("id"))
+            if spc_object is None:
+                continue
+            before = state(spc_object)
+            spc_object.update(data)
+            if state(spc_object) != before:
+                changed.append(spc_object)
+    return changed
+
+
+class WarmStart:
+    """Persist the last topology and telemetry so entities start populated.
+
+    Each source loaded from the snapshot stays stale until its live refresh
+    lands. Writes are coalesced and saved in the background.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the snapshot."""
+        self.hass = hass
+        self.entry_id = entry_id
+        self._store: Store[dict[str, Any]] = Store(
+            hass, SNAPSHOT_STORAGE_VERSION, SNAPSHOT_STORAGE_KEY.format(entry_id)
+        )
+        self._data: dict[str, Any] = {}
+        self._stale: set[str] = set()
+
+    async def async_load(self) -> None:
+        """Load the stored snapshot."""
+        self._data = await self._store.async_load() or {}
+        _LOGGER.debug("Loaded warm-start snapshot of %s", ", ".join(self._data) or "nothing")
+
+    def get(self, source: str) -> Any:
+        """Return stored data of a source and mark it stale."""
+        data = self._data.get(source)
+        if data is not None:
+            self._stale.add(source)
+        return data
+
+    def is_stale(self, source: str) -> bool:
+        """Return true if a source still shows snapshot data."""
+        return source in self._stale
+
+    @callback
+    def async_discard(self, source: str) -> None:
+        """Forget the stored data of a source."""
+        if self._data.pop(source, None) is not None:
+            self._store.async_delay_save(lambda: self._data, SAVE_DELAY)
+
+    @callback
+    def async_update(self, source: str, data: Any) -> None:
+        """Record live data of a source and mark it fresh."""
+        if data is None:
+            return
+        self._data[source] = data
+        self._store.async_delay_save(lambda: self._data, SAVE_DELAY)
+        if source in self._stale:
+            self._stale.discard(source)
+            async_dispatcher_send(
+                self.hass, SIGNAL_WARM_START_FRESH.format(self.entry_id, source)
+            )
+
+
+class WarmStartEntity(Entity):
+    """Report an assumed state while an entity shows snapshot data."""
+
+    _panel: SpcPanel
+    _warm_start_source = SOURCE_TOPOLOGY
+
+    @property
+    def _warm_start(self) -> WarmStart | None:
+        """Return the warm-start snapshot of the entity's panel."""
+        if (runtime := get_runtime(self.hass, self._panel.entry_id)) is None:
+            return None
+        return runtime.warm_start
+
+    @property
+    def assumed_state(self) -> bool:
+        """Return true while the value comes from the warm-start snapshot."""
+        warm_start = self._warm_start
+        return warm_start is not None and warm_start.is_stale(self._warm_start_source)
+
+    async def async_added_to_hass(self) -> None:
+        """Rewrite state once live data replaces the snapshot."""
+        await super().async_added_to_hass()
+        warm_start = self._warm_start
+        if warm_start is not None and warm_start.is_stale(self._warm_start_source):
+            self.async_on_remove(
+                async_dispatcher_connect(
+                    self.hass,
+                    SIGNAL_WARM_START_FRESH.format(
+                        self._panel.entry_id, self._warm_start_source
+                    ),
+                    self._async_warm_start_fresh,
+                )
+            )
+
+    @callback
+    def _async_warm_start_fresh(self) -> None:
+        """Write the live state once the snapshot is replaced."""
+        self.async_write_ha_state()
+
+
+class RestoredStateEntity(RestoreEntity):
+    """Show the last recorded state until the panel reports a live one.
+
+    Only used when neither live data nor the warm-start snapshot has a
+    value for the entity. The restored state is reported as assumed and
+    gives way to live data as soon as it arrives.
+    """
+
+    _restored_state: str | None = None
+
+    @property
+    def _has_live_state(self) -> bool:
+        """Return true once the panel data holds a state for the entity."""
+        return True
+
+    @property
+    def _showing_restored(self) -> bool:
+        """Return true while the state comes from the state store."""
+        return self._restored_state is not None and not self._has_live_state
+
+    @property
+    def assumed_state(self) -> bool:
+        """Return true while the state is restored or from the snapshot."""
+        return self._showing_restored or super().assumed_state
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the last state if the panel has none yet."""
+        await super().async_added_to_hass()
+        if self._has_live_state:
+            return
+        last_state = await self.async_get_last_state()
+        if last_state is not None and last_state.state not in (
+            STATE_UNAVAILABLE,
+            STATE_UNKNOWN,
+        ):
+            self._restored_state = last_state.state
+            _LOGGER.debug("Restored %s as %s", self.entity_id, last_state.state)
@@ -0,0 +1,117 @@
+"""Per-area zone state index for acre Intrusion."""
+from __future__ import annotations
+
+from pyspcwebgw.const import ZoneInput, ZoneStatus, ZoneType
+from pyspcwebgw.zone import Zone
+
+OPEN = 0
+INHIBITED = 1
+ISOLATED = 2
+GATING = 3
+
+# Zone types whose open input stops a full set; fire, technical and panic
+# zones are monitored around the clock and entry/exit zones are expected to
+# be open while the exit timer runs
+GATING_TYPES = frozenset({ZoneType.ALARM})
+
+
+class ZoneStateIndex:
+    """Bitset-backed index of zone states, grouped by area.
+
+    Each area keeps one integer bitset per flag, where a zone's bit is its
+    position within the area. Zone events update single bits, so readiness
+    and "any open zone" questions are answered without scanning zones.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._slots: dict[str, tuple[str, int]] = {}
+        self._zones: dict[str, list[Zone]] = {}
+        self._masks: dict[str, list[int]] = {}
+
+    def build(self, zones) -> None:
+        """Index every zone from scratch."""
+        self._slots.clear()
+        self._zones.clear()
+        self._masks.clear()
+        for zone in zones:
+            area_id = zone.area.id
+            members = self._zones.setdefault(area_id, [])
+            self._slots[zone.id] = (area_id, len(members))
+            members.append(zone)
+            masks = self._masks.setdefault(area_id, [0, 0, 0, 0])
+            if zone.type in GATING_TYPES:
+                masks[GATING] |= 1 << self._slots[zone.id][1]
+            self.update(zone)
+
+    def update(self, zone: Zone) -> bool:
+        """Update the bits of a single zone, returning true if any flipped."""
+        slot = self._slots.get(zone.id)
+        if slot is None:
+            return False
+        area_id, position = slot
+        bit = 1 << position
+        masks = self._masks[area_id]
+        flags = (
+            zone.input == ZoneInput.OPEN,
+            zone.status == ZoneStatus.INHIBIT,
+            zone.status == ZoneStatus.ISOLATE,
+        )
+        changed = False
+        for flag, value in enumerate(flags):
+            current = masks[flag] & bit
+            if value and not current:
+                masks[flag] |= bit
+                changed = True
+            elif current and not value:
+                masks[flag] &= ~bit
+                changed = True
+        return changed
+
+    def _members(self, area_id: str, mask: int) -> list[Zone]:
+        """Return the zones whose bits are set in mask."""
+        members = self._zones[area_id]
+        found = []
+        while mask:
+            lowest = mask & -mask
+            found.append(members[lowest.bit_length() - 1])
+            mask ^= lowest
+        return found
+
+    def _blocking_mask(self, area_id: str) -> int:
+        """Return the bitset of open alarm zones that are not inhibited or isolated."""
+        masks = self._masks.get(area_id)
+        if masks is None:
+            return 0
+        return masks[OPEN] & masks[GATING] & ~(masks[INHIBITED] | masks[ISOLATED])
+
+    def is_ready(self, area_id: str) -> bool:
+        """Return true if no open zone would block fully setting the area."""
+        return not self._blocking_mask(area_id)
+
+    def has_open_zones(self, area_id: str) -> bool:
+        """Return true if any zone in the area is open."""
+        masks = self._masks.get(area_id)
+        return bool(masks and masks[OPEN])
+
+    def open_count(self, area_id: str) -> int:
+        """Return the number of open zones in the area."""
+        masks = self._masks.get(area_id)
+        return masks[OPEN].bit_count() if masks else 0
+
+    def open_zones(self, area_id: str) -> list[Zone]:
+        """Return the open zones in the area."""
+        masks = self._masks.get(area_id)
+        return self._members(area_id, masks[OPEN]) if masks else []
+
+    def bypassed_zones(self, area_id: str) -> list[Zone]:
+        """Return the inhibited or isolated zones in the area."""
+        masks = self._masks.get(area_id)
+        if masks is None:
+            return []
+        return self._members(area_id, masks[INHIBITED] | masks[ISOLATED])
+
+    def blocking_zones(self, area_id: str) -> list[Zone]:
+        """Return the zones that would block fully setting the area."""
+        mask = self._blocking_mask(area_id)
+        return self._members(area_id, mask) if mask else []